@@ -1,9 +1,14 @@
 from fastmcp import FastMCP
 import os.path
+import asyncio
 import base64
+import io
 import json
 import sys
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from urllib.parse import urlparse, parse_qs
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from email.message import EmailMessage
@@ -12,6 +17,7 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 
@@ -34,6 +40,16 @@ CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
 CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
 CRED_FILE_PATH = os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json')
 AUTH_PORT = int(os.getenv('AUTH_PORT', '3838'))
+EXPORT_CHUNK_SIZE = 1024 * 1024
+BATCH_CHUNK = 1000
+RETRY_STATUSES = (429, 500, 503)
+MAX_RETRIES = 4
+EXPORT_PREVIEW_BYTES = 150  # encodes to a 200-character base64 excerpt
+EXPORT_WORKERS = 3
+BATCH_GET_LIMIT = 100  # Google's cap on calls per batch HTTP request
+PRESENTATION_CACHE_TTL = 60
+PRESENTATION_CACHE_SIZE = 256
+PRESENTATION_CACHE_BYTES = 32 * 1024 * 1024  # full txt exports can be large, so cap the total too
 
 mcp = FastMCP("Google Cloud MCP")
 
@@ -53,6 +69,55 @@ def get_credentials():
         )
     return creds
 
+# (thread id, api name, version) -> (service, creds). httplib2 clients are not
+# thread-safe, so a client is only ever reused by the thread that built it.
+_services = {}
+_services_lock = threading.Lock()
+
+def _clear_service_cache():
+    with _services_lock:
+        _services.clear()
+
+def _get_service(name, version):
+    """Return a cached API client so tool calls skip credential loading and discovery.
+
+    The client refreshes its own access token; the cache entry is only rebuilt
+    once the credentials have expired with no refresh token left to use.
+    """
+    key = (threading.get_ident(), name, version)
+    cached = _services.get(key)
+    if cached is None or (cached[1].expired and not cached[1].refresh_token):
+        creds = get_credentials()
+        cached = (build(name, version, credentials=creds), creds)
+        with _services_lock:
+            _services[key] = cached
+    return cached[0]
+
+def _execute(request):
+    """Execute an API request, backing off exponentially (1s, 2s, 4s, ...) on rate-limit and transient errors."""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if e.resp.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise
+            time.sleep(2 ** attempt)
+
+def _iter_export_chunks(service, file_id, mime):
+    """Yield a Drive export EXPORT_CHUNK_SIZE bytes at a time instead of one buffered response."""
+    request = service.files().export_media(fileId=file_id, mimeType=mime)
+    buf = io.BytesIO()
+    downloader = MediaIoBaseDownload(buf, request, chunksize=EXPORT_CHUNK_SIZE)
+    done = False
+    while not done:
+        _, done = downloader.next_chunk()
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+def _export_file(service, file_id, mime):
+    return b''.join(_iter_export_chunks(service, file_id, mime))
+
 # --- AUTH PORTAL ---
 
 _pending_flow = None
@@ -106,6 +171,7 @@ class AuthPortalHandler(BaseHTTPRequestHandler):
                 _pending_flow.fetch_token(code=code)
                 with open(TOKEN_FILE_PATH, 'w') as f:
                     f.write(_pending_flow.credentials.to_json())
+                _clear_service_cache()
                 html = """<html><body style='font-family:sans-serif;padding:50px;background:#f0f2f5;display:flex;justify-content:center'>
                 <div style='max-width:500px;background:#fff;padding:40px;border-radius:15px;box-shadow:0 4px 20px rgba(0,0,0,.1);text-align:center'>
                 <h1 style='color:#4CAF50'>Authenticated!</h1><p>Token saved. You can now use Google services through MCP.</p>
@@ -148,7 +214,7 @@ threading.Thread(target=_start_portal, daemon=True).start()
 def get_account_info():
     """Get the email address of the currently authenticated Google account."""
     try:
-        service = build('gmail', 'v1', credentials=get_credentials())
+        service = _get_service('gmail', 'v1')
         profile = service.users().getProfile(userId='me').execute()
         return f"🐶 Authenticated as: {profile.get('emailAddress')} (Gâu!)"
     except Exception as e: return f"❌ Error: {e}"
@@ -157,7 +223,7 @@ def get_account_info():
 def create_gmail_label(name: str):
     """Create a new label in Gmail."""
     try:
-        service = build('gmail', 'v1', credentials=get_credentials())
+        service = _get_service('gmail', 'v1')
         label = {'name': name, 'labelListVisibility': 'labelShow', 'messageListVisibility': 'show'}
         res = service.users().labels().create(userId='me', body=label).execute()
         return f"✅ Label '{name}' created."
@@ -167,7 +233,7 @@ def create_gmail_label(name: str):
 def list_gmail_labels():
     """List all user labels in Gmail."""
     try:
-        service = build('gmail', 'v1', credentials=get_credentials())
+        service = _get_service('gmail', 'v1')
         res = service.users().labels().list(userId='me').execute()
         labels = [l['name'] for l in res.get('labels', []) if l['type'] == 'user']
         return "\n".join(labels) if labels else "No user labels found."
@@ -183,7 +249,7 @@ def send_email(to: str, subject: str, body: str):
     that would obscure the original subject line text.
     """
     try:
-        service = build('gmail', 'v1', credentials=get_credentials())
+        service = _get_service('gmail', 'v1')
         # Minimal UTF-8 email message with explicit headers
         raw_message = (
             f"To: {to}\n"
@@ -206,7 +272,7 @@ def send_email(to: str, subject: str, body: str):
 def list_calendar_events(max_results: int = 10, days_back: int = 0):
     """List events. Timezone: Asia/Ho_Chi_Minh."""
     try:
-        service = build('calendar', 'v3', credentials=get_credentials())
+        service = _get_service('calendar', 'v3')
         time_min = (datetime.utcnow() - timedelta(days=days_back)).isoformat() + 'Z'
         res = service.events().list(calendarId='primary', timeMin=time_min,
                                     maxResults=max_results, singleEvents=True,
@@ -220,7 +286,7 @@ def list_calendar_events(max_results: int = 10, days_back: int = 0):
 def create_calendar_event(summary: str, start_time: str, end_time: str, description: str = ""):
     """Create a calendar event. format: YYYY-MM-DDTHH:MM (VN Time)."""
     try:
-        service = build('calendar', 'v3', credentials=get_credentials())
+        service = _get_service('calendar', 'v3')
         event = {
             'summary': summary, 'description': description,
             'start': {'dateTime': f"{start_time}:00", 'timeZone': 'Asia/Ho_Chi_Minh'},
@@ -236,7 +302,7 @@ def create_calendar_event(summary: str, start_time: str, end_time: str, descript
 def list_drive_folders(parent_id: str = "root"):
     """List all folders in Google Drive. parent_id: 'root' for main folder."""
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
+        service = _get_service('drive', 'v3')
         query = f"'{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
         res = service.files().list(q=query, fields='files(id, name, webViewLink)', pageSize=100).execute()
         items = res.get('files', [])
@@ -249,7 +315,7 @@ def list_drive_folders(parent_id: str = "root"):
 def search_drive(query: str):
     """Search for files in Google Drive."""
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
+        service = _get_service('drive', 'v3')
         res = service.files().list(q=query, fields='files(id, name, mimeType)').execute()
         items = res.get('files', [])
         return "\n".join([f"- {item['name']} ({item['id']})" for item in items]) if items else "No files found."
@@ -261,7 +327,7 @@ def search_drive(query: str):
 def create_document(title: str, body_text: str = ""):
     """Create a new Google Docs document with optional initial text."""
     try:
-        service = build('docs', 'v1', credentials=get_credentials())
+        service = _get_service('docs', 'v1')
         doc = service.documents().create(body={'title': title}).execute()
         doc_id = doc['documentId']
         if body_text:
@@ -275,7 +341,7 @@ def create_document(title: str, body_text: str = ""):
 def get_document(document_id: str):
     """Get the full text content of a Google Docs document by its ID."""
     try:
-        service = build('docs', 'v1', credentials=get_credentials())
+        service = _get_service('docs', 'v1')
         doc = service.documents().get(documentId=document_id).execute()
         title = doc.get('title', '')
         text = ''
@@ -293,7 +359,7 @@ def get_document(document_id: str):
 def append_to_document(document_id: str, text: str):
     """Append text to the end of a Google Docs document."""
     try:
-        service = build('docs', 'v1', credentials=get_credentials())
+        service = _get_service('docs', 'v1')
         doc = service.documents().get(documentId=document_id).execute()
         end_index = doc['body']['content'][-1]['endIndex'] - 1
         service.documents().batchUpdate(documentId=document_id, body={
@@ -306,7 +372,7 @@ def append_to_document(document_id: str, text: str):
 def search_documents(query: str = "", max_results: int = 20):
     """Search for Google Docs documents in Drive. Empty query lists recent docs."""
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
+        service = _get_service('drive', 'v3')
         q = "mimeType='application/vnd.google-apps.document'"
         if query:
             q += f" and fullText contains '{query}'"
@@ -322,7 +388,7 @@ def search_documents(query: str = "", max_results: int = 20):
 def export_document(document_id: str, format: str = "text"):
     """Export a Google Docs document. Formats: text, html, pdf, docx."""
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
+        service = _get_service('drive', 'v3')
         mime_map = {
             'text': 'text/plain',
             'html': 'text/html',
@@ -344,7 +410,7 @@ def export_document(document_id: str, format: str = "text"):
 def create_spreadsheet(title: str, sheet_name: str = "Sheet1"):
     """Create a new Google Sheets spreadsheet."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         spreadsheet = service.spreadsheets().create(body={
             'properties': {'title': title},
             'sheets': [{'properties': {'title': sheet_name}}]
@@ -358,7 +424,7 @@ def create_spreadsheet(title: str, sheet_name: str = "Sheet1"):
 def read_spreadsheet(spreadsheet_id: str, range: str = "Sheet1"):
     """Read data from a Google Sheets spreadsheet. Range format: 'Sheet1!A1:D10' or 'Sheet1'."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         res = service.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
             range=range
@@ -374,7 +440,7 @@ def read_spreadsheet(spreadsheet_id: str, range: str = "Sheet1"):
 def update_spreadsheet(spreadsheet_id: str, range: str, values: str):
     """Update cells in a spreadsheet. Values format: JSON 2D array, e.g. '[["A","B"],["1","2"]]'. Range: 'Sheet1!A1'."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         parsed = json.loads(values)
         service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
@@ -392,7 +458,7 @@ def update_spreadsheet(spreadsheet_id: str, range: str, values: str):
 def append_to_spreadsheet(spreadsheet_id: str, range: str, values: str):
     """Append rows to a spreadsheet. Values format: JSON 2D array. Range: 'Sheet1!A1'."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         parsed = json.loads(values)
         res = service.spreadsheets().values().append(
             spreadsheetId=spreadsheet_id,
@@ -408,20 +474,24 @@ def append_to_spreadsheet(spreadsheet_id: str, range: str, values: str):
     except Exception as e:
         return str(e)
 
+def _list_spreadsheets(service, query, max_results):
+    q = "mimeType='application/vnd.google-apps.spreadsheet'"
+    if query:
+        q += f" and name contains '{query}'"
+    res = _execute(service.files().list(
+        q=q,
+        pageSize=max_results,
+        fields='files(id,name,modifiedTime)',
+        orderBy='modifiedTime desc'
+    ))
+    return res.get('files', [])
+
 @mcp.tool()
 def search_spreadsheets(query: str = "", max_results: int = 20):
-    """Search for Google Sheets spreadsheets in Drive. Empty query lists recent sheets."""
+    """Search for Google Sheets spreadsheets in Drive by title. Empty query lists recent sheets."""
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
-        q = "mimeType='application/vnd.google-apps.spreadsheet'"
-        if query:
-            q += f" and fullText contains '{query}'"
-        res = service.files().list(
-            q=q,
-            pageSize=max_results,
-            fields='files(id, name, mimeType, modifiedTime)'
-        ).execute()
-        items = res.get('files', [])
+        service = _get_service('drive', 'v3')
+        items = _list_spreadsheets(service, query, max_results)
         if not items:
             return "No spreadsheets found."
         return "\n".join(
@@ -437,7 +507,7 @@ def search_spreadsheets(query: str = "", max_results: int = 20):
 def get_spreadsheet_info(spreadsheet_id: str):
     """Get metadata about a spreadsheet: title, sheets, and their dimensions."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         meta = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
         title = meta.get('properties', {}).get('title', '')
         sheets = []
@@ -455,7 +525,7 @@ def get_spreadsheet_info(spreadsheet_id: str):
 def clear_spreadsheet_range(spreadsheet_id: str, range: str):
     """Clear all values in a range. Range format: 'Sheet1!A1:D10'."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         service.spreadsheets().values().clear(
             spreadsheetId=spreadsheet_id,
             range=range
@@ -464,19 +534,33 @@ def clear_spreadsheet_range(spreadsheet_id: str, range: str):
     except Exception as e:
         return str(e)
 
+_BATCH_DATA_USE = "Use format: [{\"range\":\"Sheet1!A1\",\"values\":[[\"X\"]]}]"
+
 @mcp.tool()
 def batch_update_spreadsheet(spreadsheet_id: str, data: str):
     """Batch update multiple ranges. Data format: JSON array of {range, values}, e.g. '[{\"range\":\"Sheet1!A1\",\"values\":[[\"X\"]]}]'."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         parsed = json.loads(data)
-        service.spreadsheets().values().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body={'valueInputOption': 'USER_ENTERED', 'data': parsed}
-        ).execute()
-        return f"✅ Batch updated {len(parsed)} ranges"
+        if not isinstance(parsed, list):
+            return f"❌ Data must be a JSON array. {_BATCH_DATA_USE}"
+        # Send at most BATCH_CHUNK ranges per request to stay under request-size limits
+        cells = 0
+        for start in range(0, len(parsed), BATCH_CHUNK):
+            try:
+                result = _execute(service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={'valueInputOption': 'USER_ENTERED', 'data': parsed[start:start + BATCH_CHUNK]}
+                ))
+            except Exception as e:
+                if not start:
+                    raise
+                # Earlier chunks are already committed, so say how far it got
+                return f"❌ Applied {start} of {len(parsed)} ranges ({cells} cells) before error: {e}"
+            cells += result.get('totalUpdatedCells', 0)
+        return f"✅ Batch updated {len(parsed)} ranges ({cells} cells)"
     except json.JSONDecodeError:
-        return "❌ Invalid JSON. Use format: [{\"range\":\"Sheet1!A1\",\"values\":[[\"X\"]]}]"
+        return f"❌ Invalid JSON. {_BATCH_DATA_USE}"
     except Exception as e:
         return str(e)
 
@@ -484,7 +568,7 @@ def batch_update_spreadsheet(spreadsheet_id: str, data: str):
 def add_sheet(spreadsheet_id: str, sheet_name: str):
     """Add a new sheet/tab to an existing spreadsheet."""
     try:
-        service = build('sheets', 'v4', credentials=get_credentials())
+        service = _get_service('sheets', 'v4')
         service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={'requests': [{'addSheet': {'properties': {'title': sheet_name}}}]}
@@ -493,25 +577,57 @@ def add_sheet(spreadsheet_id: str, sheet_name: str):
     except Exception as e:
         return str(e)
 
+_FORMAT_MIME = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf',
+    'tsv': 'text/tab-separated-values'
+}
+_FORMAT_USE = f"Use: {', '.join(_FORMAT_MIME)}"
+
+def _render_spreadsheet_export(service, spreadsheet_id, format):
+    content = _export_file(service, spreadsheet_id, _FORMAT_MIME[format])
+    if format in ('csv', 'tsv'):
+        return content.decode('utf-8')
+    encoded = base64.b64encode(content[:EXPORT_PREVIEW_BYTES]).decode('utf-8')
+    return f"✅ Exported as {format} (base64, {len(content)} bytes):\n{encoded}..."
+
 @mcp.tool()
 def export_spreadsheet(spreadsheet_id: str, format: str = "csv", sheet_id: int = 0):
     """Export a spreadsheet. Formats: csv, xlsx, pdf, tsv. sheet_id: 0 for first sheet."""
+    if format not in _FORMAT_MIME:
+        return f"❌ Unsupported format '{format}'. {_FORMAT_USE}"
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
-        mime_map = {
-            'csv': 'text/csv',
-            'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'pdf': 'application/pdf',
-            'tsv': 'text/tab-separated-values'
-        }
-        mime = mime_map.get(format)
-        if not mime:
-            return f"❌ Unsupported format '{format}'. Use: csv, xlsx, pdf, tsv"
-        content = service.files().export(fileId=spreadsheet_id, mimeType=mime).execute()
-        if format in ('csv', 'tsv'):
-            return content.decode('utf-8') if isinstance(content, bytes) else content
-        encoded = base64.b64encode(content).decode('utf-8')
-        return f"✅ Exported as {format} (base64, {len(content)} bytes):\n{encoded[:200]}..."
+        service = _get_service('drive', 'v3')
+        return _render_spreadsheet_export(service, spreadsheet_id, format)
+    except Exception as e:
+        return str(e)
+
+def _export_match(file_id, format):
+    try:
+        service = _get_service('drive', 'v3')
+        return _render_spreadsheet_export(service, file_id, format)
+    except Exception as e:
+        return str(e)
+
+@mcp.tool()
+async def search_and_export(query: str, format: str = "csv", max_results: int = 5):
+    """Search spreadsheets by title and export the matches concurrently, up to 3 at a time. Formats: csv, xlsx, pdf, tsv."""
+    if format not in _FORMAT_MIME:
+        return f"❌ Unsupported format '{format}'. {_FORMAT_USE}"
+    try:
+        loop = asyncio.get_running_loop()
+        items = await loop.run_in_executor(None, lambda: _list_spreadsheets(_get_service('drive', 'v3'), query, max_results))
+        if not items:
+            return "No spreadsheets found."
+        limit = asyncio.Semaphore(EXPORT_WORKERS)
+
+        async def export(sid):
+            async with limit:
+                return await loop.run_in_executor(None, _export_match, sid, format)
+
+        exports = await asyncio.gather(*[export(f['id']) for f in items])
+        return "\n\n".join([f"📊 {f.get('name')} (ID: {f.get('id')}):\n{out}" for f, out in zip(items, exports)])
     except Exception as e:
         return str(e)
 
@@ -521,40 +637,117 @@ def export_spreadsheet(spreadsheet_id: str, format: str = "csv", sheet_id: int =
 def create_presentation(title: str):
     """Create a new Google Slides presentation."""
     try:
-        service = build('slides', 'v1', credentials=get_credentials())
+        service = _get_service('slides', 'v1')
         pres = service.presentations().create(body={'title': title}).execute()
         pid = pres['presentationId']
         return f"✅ Presentation created: https://docs.google.com/presentation/d/{pid}/edit"
     except Exception as e: return str(e)
 
+# Only what _summarize_presentation reads; skips layouts, masters and styling
+_SUMMARY_FIELDS = 'title,slides(pageElements(shape(text(textElements(textRun(content))))))'
+
+def _text_elements(element):
+    # Most page elements carry text, so direct indexing beats chained .get() with {} defaults
+    try:
+        return element['shape']['text']['textElements']
+    except (KeyError, TypeError):
+        return ()
+
+def _slide_text(slide):
+    runs = (te['textRun'].get('content', '').strip()
+            for el in slide.get('pageElements', ())
+            for te in _text_elements(el)
+            if 'textRun' in te)
+    return ' | '.join(t for t in runs if t)
+
+def _summarize_presentation(pres):
+    slides = pres.get('slides', [])
+    lines = (f"  Slide {i}: {_slide_text(slide) or '(empty)'}" for i, slide in enumerate(slides, 1))
+    return "\n".join([f"Title: {pres.get('title', '')}", f"Slides: {len(slides)}", *lines])
+
+# Summaries keyed (presentation_id, modifiedTime) and exports keyed
+# (presentation_id, format, modifiedTime) -> (stored_at, result, size),
+# least recently used first
+_pres_cache = OrderedDict()
+_pres_cache_lock = threading.Lock()
+
+def _cached_result(key):
+    with _pres_cache_lock:
+        hit = _pres_cache.get(key)
+        if hit and time.monotonic() - hit[0] < PRESENTATION_CACHE_TTL:
+            _pres_cache.move_to_end(key)
+            return hit[1]
+        _pres_cache.pop(key, None)
+    return None
+
+def _store_result(key, result):
+    """Cache result, evicting expired entries first and then the least recently used.
+
+    Keeps at most PRESENTATION_CACHE_SIZE entries and PRESENTATION_CACHE_BYTES of
+    results; a single result over the byte cap is not cached at all.
+    """
+    size = len(result.encode('utf-8'))
+    if size > PRESENTATION_CACHE_BYTES:
+        return
+    with _pres_cache_lock:
+        now = time.monotonic()
+        _pres_cache.pop(key, None)
+        used = size + sum(entry[2] for entry in _pres_cache.values())
+
+        def full():
+            return len(_pres_cache) >= PRESENTATION_CACHE_SIZE or used > PRESENTATION_CACHE_BYTES
+
+        if full():
+            for stale in [k for k, entry in _pres_cache.items() if now - entry[0] >= PRESENTATION_CACHE_TTL]:
+                used -= _pres_cache.pop(stale)[2]
+        while _pres_cache and full():
+            used -= _pres_cache.popitem(last=False)[1][2]
+        _pres_cache[key] = (now, result, size)
+
 @mcp.tool()
-def get_presentation(presentation_id: str):
-    """Get metadata and slide titles/content from a Google Slides presentation."""
+def get_presentation(presentation_id: str, text_only: bool = False):
+    """Get metadata and slide titles/content from a Google Slides presentation. text_only: return Drive's plain-text export instead."""
     try:
-        service = build('slides', 'v1', credentials=get_credentials())
-        pres = service.presentations().get(presentationId=presentation_id).execute()
-        title = pres.get('title', '')
-        slides = pres.get('slides', [])
-        result = [f"Title: {title}", f"Slides: {len(slides)}"]
-        for i, slide in enumerate(slides):
-            texts = []
-            for el in slide.get('pageElements', []):
-                shape = el.get('shape')
-                if shape and shape.get('text'):
-                    for te in shape['text'].get('textElements', []):
-                        run = te.get('textRun')
-                        if run:
-                            texts.append(run.get('content', '').strip())
-            content = ' | '.join([t for t in texts if t])
-            result.append(f"  Slide {i+1}: {content if content else '(empty)'}")
-        return "\n".join(result)
+        drive = _get_service('drive', 'v3')
+        if text_only:
+            return _render_presentation_export(drive, presentation_id, 'txt')
+        meta = drive.files().get(fileId=presentation_id, fields='modifiedTime').execute()
+        key = (presentation_id, meta.get('modifiedTime'))
+        summary = _cached_result(key)
+        if summary is None:
+            service = _get_service('slides', 'v1')
+            pres = service.presentations().get(presentationId=presentation_id, fields=_SUMMARY_FIELDS).execute()
+            summary = _summarize_presentation(pres)
+            _store_result(key, summary)
+        return summary
+    except Exception as e: return str(e)
+
+@mcp.tool()
+def get_presentations_batch(presentation_ids: list[str]):
+    """Get metadata and slide content for several presentations, up to 100 per batch HTTP request."""
+    ids = list(dict.fromkeys(presentation_ids))
+    if not ids:
+        return "No presentations given."
+    try:
+        service = _get_service('slides', 'v1')
+        results = {}
+
+        def collect(request_id, response, exception):
+            results[request_id] = str(exception) if exception else _summarize_presentation(response)
+
+        for i in range(0, len(ids), BATCH_GET_LIMIT):
+            batch = service.new_batch_http_request(callback=collect)
+            for pid in ids[i:i + BATCH_GET_LIMIT]:
+                batch.add(service.presentations().get(presentationId=pid, fields=_SUMMARY_FIELDS), request_id=pid)
+            batch.execute()
+        return "\n\n".join([f"📽️ {pid}:\n{results.get(pid, '❌ No response')}" for pid in ids])
     except Exception as e: return str(e)
 
 @mcp.tool()
 def add_slide(presentation_id: str, layout: str = "BLANK"):
     """Add a new slide to a presentation. Layouts: BLANK, TITLE, TITLE_AND_BODY, TITLE_AND_TWO_COLUMNS, TITLE_ONLY, SECTION_HEADER, CAPTION_ONLY, BIG_NUMBER."""
     try:
-        service = build('slides', 'v1', credentials=get_credentials())
+        service = _get_service('slides', 'v1')
         pres = service.presentations().get(presentationId=presentation_id).execute()
         layouts = pres.get('layouts', [])
         layout_id = None
@@ -572,36 +765,59 @@ def add_slide(presentation_id: str, layout: str = "BLANK"):
         return f"✅ Slide added (ID: {slide_id})"
     except Exception as e: return str(e)
 
+def _text_box_requests(box_id, page_id, text, x, y, width, height):
+    """createShape + insertText requests for one text box; only the per-box fields vary."""
+    return [
+        {'createShape': {
+            'objectId': box_id,
+            'shapeType': 'TEXT_BOX',
+            'elementProperties': {
+                'pageObjectId': page_id,
+                'size': {'width': {'magnitude': width, 'unit': 'PT'}, 'height': {'magnitude': height, 'unit': 'PT'}},
+                'transform': {'scaleX': 1, 'scaleY': 1, 'translateX': x, 'translateY': y, 'unit': 'PT'}
+            }
+        }},
+        {'insertText': {'objectId': box_id, 'text': text}}
+    ]
+
 @mcp.tool()
 def add_text_to_slide(presentation_id: str, slide_index: int, text: str, x: int = 100, y: int = 100, width: int = 400, height: int = 200):
     """Add a text box to a slide. slide_index: 0-based. Coordinates in points (pt)."""
     try:
-        service = build('slides', 'v1', credentials=get_credentials())
+        service = _get_service('slides', 'v1')
         pres = service.presentations().get(presentationId=presentation_id).execute()
         slides = pres.get('slides', [])
         if slide_index >= len(slides): return f"❌ Slide index {slide_index} out of range (total: {len(slides)})"
         box_id = f"textbox_{slide_index}_{hash(text) % 100000}"
-        requests = [
-            {'createShape': {
-                'objectId': box_id,
-                'shapeType': 'TEXT_BOX',
-                'elementProperties': {
-                    'pageObjectId': slides[slide_index]['objectId'],
-                    'size': {'width': {'magnitude': width, 'unit': 'PT'}, 'height': {'magnitude': height, 'unit': 'PT'}},
-                    'transform': {'scaleX': 1, 'scaleY': 1, 'translateX': x, 'translateY': y, 'unit': 'PT'}
-                }
-            }},
-            {'insertText': {'objectId': box_id, 'text': text}}
-        ]
+        requests = _text_box_requests(box_id, slides[slide_index]['objectId'], text, x, y, width, height)
         service.presentations().batchUpdate(presentationId=presentation_id, body={'requests': requests}).execute()
         return f"✅ Text box added to slide {slide_index + 1}"
     except Exception as e: return str(e)
 
+@mcp.tool()
+def add_text_to_slides(presentation_id: str, slide_indexes: list[int], text: str, x: int = 100, y: int = 100, width: int = 400, height: int = 200):
+    """Add the same text box to several slides in one batchUpdate. slide_indexes: 0-based. Coordinates in points (pt)."""
+    if not slide_indexes:
+        return "No slides given."
+    try:
+        service = _get_service('slides', 'v1')
+        pres = service.presentations().get(presentationId=presentation_id).execute()
+        slides = pres.get('slides', [])
+        bad = [i for i in slide_indexes if not 0 <= i < len(slides)]
+        if bad: return f"❌ Slide indexes {bad} out of range (total: {len(slides)})"
+        indexes = list(dict.fromkeys(slide_indexes))
+        suffix = hash(text) % 100000
+        requests = [r for i in indexes
+                    for r in _text_box_requests(f"textbox_{i}_{suffix}", slides[i]['objectId'], text, x, y, width, height)]
+        service.presentations().batchUpdate(presentationId=presentation_id, body={'requests': requests}).execute()
+        return f"✅ Text box added to slides {', '.join(str(i + 1) for i in indexes)}"
+    except Exception as e: return str(e)
+
 @mcp.tool()
 def search_presentations(query: str = "", max_results: int = 20):
     """Search for Google Slides presentations in Drive. Empty query lists recent presentations."""
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
+        service = _get_service('drive', 'v3')
         q = "mimeType='application/vnd.google-apps.presentation'"
         if query:
             q += f" and fullText contains '{query}'"
@@ -617,7 +833,7 @@ def search_presentations(query: str = "", max_results: int = 20):
 def delete_slide(presentation_id: str, slide_index: int):
     """Delete a slide from a presentation by its 0-based index."""
     try:
-        service = build('slides', 'v1', credentials=get_credentials())
+        service = _get_service('slides', 'v1')
         pres = service.presentations().get(presentationId=presentation_id).execute()
         slides = pres.get('slides', [])
         if slide_index >= len(slides): return f"❌ Slide index {slide_index} out of range (total: {len(slides)})"
@@ -628,24 +844,151 @@ def delete_slide(presentation_id: str, slide_index: int):
         return f"✅ Slide {slide_index + 1} deleted"
     except Exception as e: return str(e)
 
+# format -> (mime type, whether the export is text to return decoded)
+_EXPORT_MIME = {
+    'pdf': ('application/pdf', False),
+    'pptx': ('application/vnd.openxmlformats-officedocument.presentationml.presentation', False),
+    'txt': ('text/plain', True)
+}
+_EXPORT_USE = f"Use: {', '.join(_EXPORT_MIME)}"
+
+def _render_presentation_export(service, presentation_id, format):
+    mime, decode = _EXPORT_MIME[format]
+    content = _export_file(service, presentation_id, mime)
+    if decode:
+        return content.decode('utf-8')
+    encoded = base64.b64encode(content[:EXPORT_PREVIEW_BYTES]).decode('utf-8')
+    return f"✅ Exported as {format} (base64, {len(content)} bytes):\n{encoded}..."
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+def _coalesced(key, fn):
+    """Run fn once for concurrent callers with the same key; the rest wait for its result."""
+    with _in_flight_lock:
+        fut = _in_flight.get(key)
+        owner = fut is None
+        if owner:
+            fut = _in_flight[key] = Future()
+    if not owner:
+        return fut.result()
+    try:
+        result = fn()
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        # BaseException too: a cancelled or interrupted owner must still release its waiters
+        fut.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+def _cached_presentation_export(service, presentation_id, format):
+    """Reuse an export while the file's modifiedTime is unchanged, skipping the download."""
+    meta = service.files().get(fileId=presentation_id, fields='modifiedTime').execute()
+    key = (presentation_id, format, meta.get('modifiedTime'))
+
+    def export():
+        out = _render_presentation_export(service, presentation_id, format)
+        _store_result(key, out)
+        return out
+
+    out = _cached_result(key)
+    return out if out is not None else _coalesced(key, export)
+
 @mcp.tool()
 def export_presentation(presentation_id: str, format: str = "pdf"):
     """Export a presentation. Formats: pdf, pptx, txt."""
+    format = format.lower()
+    if format not in _EXPORT_MIME:
+        return f"❌ Unsupported format '{format}'. {_EXPORT_USE}"
     try:
-        service = build('drive', 'v3', credentials=get_credentials())
-        mime_map = {
-            'pdf': 'application/pdf',
-            'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            'txt': 'text/plain'
-        }
-        mime = mime_map.get(format)
-        if not mime: return f"❌ Unsupported format '{format}'. Use: pdf, pptx, txt"
-        content = service.files().export(fileId=presentation_id, mimeType=mime).execute()
-        if format == 'txt':
-            return content.decode('utf-8') if isinstance(content, bytes) else content
-        encoded = base64.b64encode(content).decode('utf-8')
-        return f"✅ Exported as {format} (base64, {len(content)} bytes):\n{encoded[:200]}..."
+        service = _get_service('drive', 'v3')
+        return _cached_presentation_export(service, presentation_id, format)
     except Exception as e: return str(e)
 
+def _export_presentation_match(presentation_id, format):
+    try:
+        return _cached_presentation_export(_get_service('drive', 'v3'), presentation_id, format)
+    except Exception as e:
+        return str(e)
+
+@mcp.tool()
+async def export_presentations_batch(presentation_ids: list[str], format: str = "pdf"):
+    """Export several presentations concurrently, up to 3 at a time. Formats: pdf, pptx, txt."""
+    format = format.lower()
+    if format not in _EXPORT_MIME:
+        return f"❌ Unsupported format '{format}'. {_EXPORT_USE}"
+    if not presentation_ids:
+        return "No presentations to export."
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(EXPORT_WORKERS)
+
+    async def export(pid):
+        async with limit:
+            return await loop.run_in_executor(None, _export_presentation_match, pid, format)
+
+    exports = await asyncio.gather(*[export(pid) for pid in presentation_ids])
+    return "\n\n".join([f"📽️ {pid}:\n{out}" for pid, out in zip(presentation_ids, exports)])
+
+async def stream_export(presentation_ids, format='pdf'):
+    """Yield (presentation_id, chunk) pairs as export chunks arrive.
+
+    Library helper for code that embeds the server; it is not an MCP tool,
+    since tools return a single result.
+
+    At most EXPORT_WORKERS downloads run at once and each waits while the queue
+    is full, so memory stays bounded by the worker count, not by the deck sizes.
+    """
+    format = format.lower()
+    if format not in _EXPORT_MIME:
+        raise ValueError(f"Unsupported format '{format}'. {_EXPORT_USE}")
+    mime, _ = _EXPORT_MIME[format]
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=EXPORT_WORKERS)
+    limit = asyncio.Semaphore(EXPORT_WORKERS)
+    stop = threading.Event()
+    finished = object()
+
+    async def put(item):
+        if not stop.is_set():
+            await queue.put(item)
+
+    def pump(pid):
+        if stop.is_set():
+            return
+        for chunk in _iter_export_chunks(_get_service('drive', 'v3'), pid, mime):
+            if stop.is_set():
+                return
+            asyncio.run_coroutine_threadsafe(put((pid, chunk)), loop).result()
+
+    async def export(pid):
+        if stop.is_set():
+            return
+        async with limit:
+            if not stop.is_set():
+                await loop.run_in_executor(None, pump, pid)
+
+    async def run():
+        try:
+            await asyncio.gather(*[export(pid) for pid in presentation_ids])
+        finally:
+            await put(finished)
+
+    task = asyncio.create_task(run())
+    try:
+        while (item := await queue.get()) is not finished:
+            yield item
+        await task
+    finally:
+        # Stop queued exports from starting, then unblock any worker waiting on
+        # a full queue so it can see stop and exit
+        stop.set()
+        task.cancel()
+        while not queue.empty():
+            queue.get_nowait()
+        await asyncio.gather(task, return_exceptions=True)
+
 if __name__ == "__main__":
     mcp.run()
@@ -1,61 +1,163 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock
 import json
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _stub_credentials():
+    """Stub out get_credentials once per session so no test touches real OAuth state.
+
+    Tests that need to inspect the credentials call still patch it locally.
+    """
+    from google_cloud_mcp import server
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(server, 'get_credentials', Mock(return_value=Mock()))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_service_cache():
+    """Drop cached API clients and summaries so each test sees its own patched build."""
+    from google_cloud_mcp import server
+    server._clear_service_cache()
+    server._pres_cache.clear()
+    yield
+    server._clear_service_cache()
+    server._pres_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def sheets_patches(request):
+    """Patch get_credentials and build only for tests marked ``needs_sheets``.
+
+    Yields ``(mock_get_creds, mock_build)`` for marked tests and ``None``
+    otherwise, so unmarked tests pay nothing for it.
+    """
+    if request.node.get_closest_marker('needs_sheets') is None:
+        yield None
+        return
+    from google_cloud_mcp import server
+    mock_get_creds, mock_build = Mock(), Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(server, 'get_credentials', mock_get_creds)
+        mp.setattr(server, 'build', mock_build)
+        yield mock_get_creds, mock_build
+
+
 @pytest.fixture
-def mock_credentials():
-    with patch('google_cloud_mcp.server.get_credentials') as mock:
-        creds = MagicMock()
-        creds.valid = True
-        creds.expired = False
-        mock.return_value = creds
-        yield mock
+def media_download(monkeypatch):
+    """Patch MediaIoBaseDownload; set ``.content``, ``.chunks`` or ``.error`` on the returned mock.
+
+    Each downloader writes ``content`` in a single ``next_chunk()`` call, or
+    one item of ``chunks`` per call when that list is set, or raises ``error``.
+    """
+    from google_cloud_mcp import server
+    mock_cls = Mock()
+    mock_cls.content = b''
+    mock_cls.chunks = None
+    mock_cls.error = None
+
+    def factory(fd, request, chunksize):
+        downloader = Mock()
+        pending = list(mock_cls.chunks or [mock_cls.content])
+
+        def next_chunk():
+            if mock_cls.error is not None:
+                raise mock_cls.error
+            fd.write(pending.pop(0))
+            return None, not pending
+
+        downloader.next_chunk.side_effect = next_chunk
+        return downloader
+
+    mock_cls.side_effect = factory
+    monkeypatch.setattr(server, "MediaIoBaseDownload", mock_cls)
+    return mock_cls
+
+
+@pytest.fixture(scope="session")
+def _session_build_mock():
+    """One ``build`` stand-in shared by the Drive and Slides service fixtures.
+
+    It is reset before each use, so only the patching and the mock itself
+    are reused; every test still starts from a clean service.
+    """
+    return Mock()
+
+
+@pytest.fixture
+def _routed_build(_session_build_mock, monkeypatch, _module_drive_service, _module_slides_service):
+    """Patch build for this test, handing each API name its own module service.
+
+    The Drive and Slides services are built once per module and reset after
+    every test. reset_mock(return_value=True, side_effect=True) also drops
+    stubbed return values down the whole chain, so nothing one test
+    configures is visible to the next.
+    """
+    from google_cloud_mcp import server
+    services = {'drive': _module_drive_service, 'slides': _module_slides_service}
+    _session_build_mock.reset_mock(return_value=True, side_effect=True)
+    _session_build_mock.side_effect = lambda name, version, **kwargs: services[name]
+    monkeypatch.setattr(server, 'build', _session_build_mock)
+    yield _session_build_mock
+    for service in services.values():
+        service.reset_mock(return_value=True, side_effect=True)
+
+
+def _patch_build(monkeypatch):
+    from google_cloud_mcp import server
+    service = Mock()
+    mock_build = Mock(return_value=service)
+    monkeypatch.setattr(server, 'build', mock_build)
+    return service, mock_build
 
 
 @pytest.fixture
-def mock_gmail_service(mock_credentials):
-    with patch('google_cloud_mcp.server.build') as mock_build:
-        service = MagicMock()
-        mock_build.return_value = service
-        yield service, mock_build
+def mock_credentials(monkeypatch):
+    from google_cloud_mcp import server
+    creds = Mock()
+    creds.valid = True
+    creds.expired = False
+    mock = Mock(return_value=creds)
+    monkeypatch.setattr(server, 'get_credentials', mock)
+    return mock
 
 
 @pytest.fixture
-def mock_calendar_service(mock_credentials):
-    with patch('google_cloud_mcp.server.build') as mock_build:
-        service = MagicMock()
-        mock_build.return_value = service
-        yield service, mock_build
+def mock_gmail_service(mock_credentials, monkeypatch):
+    return _patch_build(monkeypatch)
 
 
 @pytest.fixture
-def mock_drive_service(mock_credentials):
-    with patch('google_cloud_mcp.server.build') as mock_build:
-        service = MagicMock()
-        mock_build.return_value = service
-        yield service, mock_build
+def mock_calendar_service(mock_credentials, monkeypatch):
+    return _patch_build(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def _module_drive_service():
+    return Mock()
 
 
 @pytest.fixture
-def mock_docs_service(mock_credentials):
-    with patch('google_cloud_mcp.server.build') as mock_build:
-        service = MagicMock()
-        mock_build.return_value = service
-        yield service, mock_build
+def mock_drive_service(mock_credentials, _routed_build, _module_drive_service):
+    return _module_drive_service, _routed_build
 
 
 @pytest.fixture
-def mock_sheets_service(mock_credentials):
-    with patch('google_cloud_mcp.server.build') as mock_build:
-        service = MagicMock()
-        mock_build.return_value = service
-        yield service, mock_build
+def mock_docs_service(mock_credentials, monkeypatch):
+    return _patch_build(monkeypatch)
+
+
+@pytest.fixture
+def mock_sheets_service(mock_credentials, monkeypatch):
+    return _patch_build(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def _module_slides_service():
+    return Mock()
 
 
 @pytest.fixture
-def mock_slides_service(mock_credentials):
-    with patch('google_cloud_mcp.server.build') as mock_build:
-        service = MagicMock()
-        mock_build.return_value = service
-        yield service, mock_build
+def mock_slides_service(mock_credentials, _routed_build, _module_slides_service):
+    return _module_slides_service, _routed_build
@@ -0,0 +1,16 @@
+"""Helpers for the read-only payloads shared across test modules."""
+
+from types import MappingProxyType
+
+
+def freeze(obj):
+    """Recursively turn dicts into read-only mappings and lists into tuples.
+
+    Module-level payloads are shared by every test, so freezing them makes
+    accidental mutation by one test fail instead of leaking into the next.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
@@ -0,0 +1,35 @@
+"""Fixtures shared by the Slides tests."""
+
+import pytest
+
+from .payloads import freeze
+
+
+@pytest.fixture(scope="module")
+def layouts_pres():
+    """Read-only presentation with a BLANK and a TITLE layout."""
+    return freeze({
+        'presentationId': 'test-pres-123',
+        'layouts': [
+            {
+                'objectId': 'layout-blank',
+                'layoutProperties': {'name': 'BLANK', 'displayName': 'Blank'}
+            },
+            {
+                'objectId': 'layout-title',
+                'layoutProperties': {'name': 'TITLE', 'displayName': 'Title Slide'}
+            }
+        ]
+    })
+
+
+@pytest.fixture(scope="module")
+def two_slide_pres():
+    """Read-only presentation with slides ``slide-1`` and ``slide-2``."""
+    return freeze({'slides': [{'objectId': 'slide-1'}, {'objectId': 'slide-2'}]})
+
+
+@pytest.fixture(scope="module")
+def three_slide_pres():
+    """Read-only presentation with slides ``slide-1`` to ``slide-3``."""
+    return freeze({'slides': [{'objectId': f'slide-{i}'} for i in (1, 2, 3)]})
@@ -0,0 +1,133 @@
+"""Read-only presentation payloads shared by the Slides tests."""
+
+from ..payloads import freeze
+
+
+# get_presentation payloads, shared read-only across the Slides tests
+TWO_SLIDE_PRES = freeze({
+    'title': 'My Presentation',
+    'slides': [
+        {
+            'objectId': 'slide1',
+            'pageElements': [
+                {
+                    'shape': {
+                        'text': {
+                            'textElements': [
+                                {'textRun': {'content': 'Title Slide\n'}},
+                                {'textRun': {'content': 'Subtitle'}}
+                            ]
+                        }
+                    }
+                }
+            ]
+        },
+        {
+            'objectId': 'slide2',
+            'pageElements': [
+                {
+                    'shape': {
+                        'text': {
+                            'textElements': [
+                                {'textRun': {'content': 'Content Slide'}}
+                            ]
+                        }
+                    }
+                }
+            ]
+        }
+    ]
+})
+
+NESTED_PRES = freeze({
+    'title': 'Complex Presentation',
+    'slides': [
+        {
+            'objectId': 'slide1',
+            'pageElements': [
+                {
+                    'shape': {
+                        'text': {
+                            'textElements': [
+                                {'textRun': {'content': 'Text 1  '}},
+                                {'textRun': {'content': '  Text 2'}}
+                            ]
+                        }
+                    }
+                },
+                {
+                    'shape': {
+                        'text': {
+                            'textElements': [
+                                {'textRun': {'content': 'Text 3'}}
+                            ]
+                        }
+                    }
+                }
+            ]
+        }
+    ]
+})
+
+IMAGE_PRES = freeze({
+    'title': 'Image Presentation',
+    'slides': [
+        {
+            'objectId': 'slide1',
+            'pageElements': [
+                {
+                    'image': {
+                        'imageProperties': {}
+                    }
+                },
+                {
+                    'shape': {}  # Shape without text
+                }
+            ]
+        }
+    ]
+})
+
+COMPLEX_PRES = freeze({
+    'title': 'Complex',
+    'slides': [
+        {
+            'objectId': 'slide-1',
+            'pageElements': [
+                {
+                    'shape': {
+                        'text': {
+                            'textElements': [
+                                {'textRun': {'content': 'Line 1\n'}},
+                                {'textRun': {'content': ''}},  # Empty run
+                                {'textRun': {'content': 'Line 2'}},
+                                {'otherElement': {}},  # Non-textRun element
+                            ]
+                        }
+                    }
+                },
+                {
+                    'shape': {
+                        # No text field
+                    }
+                }
+            ]
+        }
+    ]
+})
+
+EMPTY_SLIDE_PRES = freeze({
+    'title': 'Empty Presentation',
+    'slides': [
+        {
+            'objectId': 'slide1',
+            'pageElements': []
+        }
+    ]
+})
+
+# 100 slides without page elements
+LARGE_PRES = freeze({
+    'title': 'Large Presentation',
+    'slides': [{'objectId': f'slide-{i}'} for i in range(100)]
+})
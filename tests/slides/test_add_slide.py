@@ -0,0 +1,76 @@
+"""
+Tests for the add_slide Slides tool in google_cloud_mcp.server.
+"""
+
+import pytest
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+add_slide = server.add_slide.fn
+
+
+@pytest.fixture
+def add_slide_svc(mock_slides_service):
+    """Slides service whose batchUpdate creates slide ``new-slide-123``.
+
+    Tests only stub the presentation returned by ``get``.
+    """
+    service, _ = mock_slides_service
+    service.presentations.return_value.batchUpdate.return_value.execute.return_value = {
+        'replies': [{'createSlide': {'objectId': 'new-slide-123'}}]
+    }
+    return service
+
+
+class TestAddSlide:
+    """Test suite for add_slide function."""
+
+    @pytest.mark.parametrize("layout_in,expected_id", [
+        ("BLANK", "layout-blank"),
+        ("TITLE", "layout-title"),
+        ("title", "layout-title"),
+        ("title slide", "layout-title"),
+    ])
+    def test_add_slide_layout(self, add_slide_svc, layouts_pres, layout_in, expected_id):
+        """Test layouts match by name or display name, case-insensitively."""
+        service = add_slide_svc
+
+        service.presentations.return_value.get.return_value.execute.return_value = layouts_pres
+
+        result = add_slide(presentation_id="test-pres-123", layout=layout_in)
+
+        # Verify API calls
+        service.presentations.return_value.get.assert_called_once_with(presentationId='test-pres-123')
+
+        # Verify batchUpdate was called with the matching layout
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        assert batch_call_args[1]['presentationId'] == 'test-pres-123'
+        requests = batch_call_args[1]['body']['requests']
+        assert len(requests) == 1
+        assert requests[0]['createSlide']['slideLayoutReference']['layoutId'] == expected_id
+
+        assert all(n in result for n in ("Slide added", "new-slide-123")), result
+
+    def test_add_slide_layout_not_found(self, add_slide_svc):
+        """Test adding slide when layout is not found."""
+        service = add_slide_svc
+
+        mock_pres = {
+            'presentationId': 'test-pres-123',
+            'layouts': [
+                {
+                    'objectId': 'layout-blank',
+                    'layoutProperties': {'name': 'BLANK'}
+                }
+            ]
+        }
+        service.presentations.return_value.get.return_value.execute.return_value = mock_pres
+
+        # Request non-existent layout
+        result = add_slide(presentation_id="test-pres-123", layout="CUSTOM_LAYOUT")
+
+        # Should still create slide without specific layout
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        requests = batch_call_args[1]['body']['requests']
+        assert 'slideLayoutReference' not in requests[0]['createSlide']
+        assert "Slide added" in result
@@ -0,0 +1,114 @@
+"""
+Tests for the add_text_to_slide Slides tool in google_cloud_mcp.server.
+"""
+
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+add_text_to_slide = server.add_text_to_slide.fn
+
+
+class TestAddTextToSlide:
+    """Test suite for add_text_to_slide function."""
+
+    def test_add_text_to_slide_success(self, mock_slides_service, two_slide_pres):
+        """Test successfully adding text to a slide."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = two_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = add_text_to_slide(
+            presentation_id="test-pres-123",
+            slide_index=0,
+            text="Hello World",
+            x=100,
+            y=100,
+            width=400,
+            height=200
+        )
+
+        # Verify batchUpdate was called
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        assert batch_call_args[1]['presentationId'] == 'test-pres-123'
+
+        requests = batch_call_args[1]['body']['requests']
+        assert len(requests) == 2
+
+        # Verify createShape request
+        create_shape = requests[0]['createShape']
+        assert create_shape['shapeType'] == 'TEXT_BOX'
+        assert create_shape['elementProperties']['pageObjectId'] == 'slide-1'
+        assert create_shape['elementProperties']['size']['width']['magnitude'] == 400
+        assert create_shape['elementProperties']['size']['height']['magnitude'] == 200
+        assert create_shape['elementProperties']['transform']['translateX'] == 100
+        assert create_shape['elementProperties']['transform']['translateY'] == 100
+
+        # Verify insertText request
+        insert_text = requests[1]['insertText']
+        assert insert_text['text'] == 'Hello World'
+        assert 'objectId' in insert_text
+
+        assert "Text box added to slide 1" in result
+
+    def test_add_text_to_slide_custom_coordinates(self, mock_slides_service):
+        """Test adding text with custom coordinates."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {
+            'slides': [{'objectId': 'slide-1'}]
+        }
+        service.presentations.return_value.get.return_value.execute.return_value = mock_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = add_text_to_slide(
+            presentation_id="test-pres-123",
+            slide_index=0,
+            text="Custom Position",
+            x=50,
+            y=75,
+            width=300,
+            height=150
+        )
+
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        create_shape = batch_call_args[1]['body']['requests'][0]['createShape']
+
+        assert create_shape['elementProperties']['transform']['translateX'] == 50
+        assert create_shape['elementProperties']['transform']['translateY'] == 75
+        assert create_shape['elementProperties']['size']['width']['magnitude'] == 300
+        assert create_shape['elementProperties']['size']['height']['magnitude'] == 150
+
+    def test_add_text_to_slide_index_out_of_range(self, mock_slides_service, two_slide_pres):
+        """Test adding text to slide with invalid index."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = two_slide_pres
+
+        # Try to add text to slide index 2 (only 0 and 1 exist)
+        result = add_text_to_slide(
+            presentation_id="test-pres-123",
+            slide_index=2,
+            text="Should fail"
+        )
+
+        # Should return error without calling batchUpdate
+        assert all(n in result for n in ("Slide index 2 out of range", "total: 2")), result
+        service.presentations.return_value.batchUpdate.assert_not_called()
+
+    def test_add_text_to_slide_empty_presentation(self, mock_slides_service):
+        """Test adding text to empty presentation."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {
+            'slides': []
+        }
+        service.presentations.return_value.get.return_value.execute.return_value = mock_pres
+
+        result = add_text_to_slide(
+            presentation_id="test-pres-123",
+            slide_index=0,
+            text="No slides"
+        )
+
+        assert all(n in result for n in ("Slide index 0 out of range", "total: 0")), result
@@ -0,0 +1,61 @@
+"""
+Tests for the add_text_to_slides Slides tool in google_cloud_mcp.server.
+"""
+
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+add_text_to_slides = server.add_text_to_slides.fn
+
+
+class TestAddTextToSlides:
+    """Test suite for add_text_to_slides function."""
+
+    def test_add_text_to_slides_single_batch(self, mock_slides_service, three_slide_pres):
+        """Test one batchUpdate carries a text box for every requested slide."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = three_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = add_text_to_slides(presentation_id="test-pres-123", slide_indexes=[0, 2], text="Confidential 机密")
+
+        service.presentations.return_value.batchUpdate.assert_called_once()
+        requests = service.presentations.return_value.batchUpdate.call_args[1]['body']['requests']
+        pages = [r['createShape']['elementProperties']['pageObjectId'] for r in requests[::2]]
+        assert pages == ['slide-1', 'slide-3']
+        assert all(r['insertText']['text'] == "Confidential 机密" for r in requests[1::2])
+        assert result == "✅ Text box added to slides 1, 3"
+
+    def test_add_text_to_slides_duplicate_indexes(self, mock_slides_service, three_slide_pres):
+        """Test a repeated index only gets one text box."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = three_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = add_text_to_slides(presentation_id="test-pres-123", slide_indexes=[1, 1], text="Draft")
+
+        requests = service.presentations.return_value.batchUpdate.call_args[1]['body']['requests']
+        assert len(requests) == 2
+        assert result == "✅ Text box added to slides 2"
+
+    def test_add_text_to_slides_out_of_range(self, mock_slides_service, two_slide_pres):
+        """Test out-of-range indexes are reported and nothing is written."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = two_slide_pres
+
+        result = add_text_to_slides(presentation_id="test-pres-123", slide_indexes=[0, 5, -1], text="Draft")
+
+        assert result == "❌ Slide indexes [5, -1] out of range (total: 2)"
+        service.presentations.return_value.batchUpdate.assert_not_called()
+
+    def test_add_text_to_slides_empty(self, mock_slides_service):
+        """Test an empty index list."""
+        service, mock_build = mock_slides_service
+
+        result = add_text_to_slides(presentation_id="test-pres-123", slide_indexes=[], text="Draft")
+
+        assert result == "No slides given."
+        mock_build.assert_not_called()
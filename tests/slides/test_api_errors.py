@@ -0,0 +1,41 @@
+"""
+API error handling shared by every Slides tool in google_cloud_mcp.server.
+"""
+
+import pytest
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+create_presentation = server.create_presentation.fn
+get_presentation = server.get_presentation.fn
+add_slide = server.add_slide.fn
+add_text_to_slide = server.add_text_to_slide.fn
+search_presentations = server.search_presentations.fn
+delete_slide = server.delete_slide.fn
+
+
+class TestApiErrors:
+    """API failures are returned as the error message for every tool."""
+
+    @pytest.mark.parametrize("fn,kwargs,mock_path,msg", [
+        (create_presentation, {"title": "Test Presentation"}, "presentations.create", "API Error"),
+        (get_presentation, {"presentation_id": "invalid-id"}, "presentations.get", "Presentation not found"),
+        (add_slide, {"presentation_id": "invalid-id"}, "presentations.get", "Failed to get presentation"),
+        (add_text_to_slide, {"presentation_id": "test-pres-123", "slide_index": 0, "text": "Test"},
+         "presentations.get", "Network error"),
+        (search_presentations, {"query": "Test"}, "files.list", "Drive API error"),
+        (delete_slide, {"presentation_id": "test-pres-123", "slide_index": 0}, "presentations.get", "Permission denied"),
+    ], ids=lambda v: v.__name__ if callable(v) else None)
+    def test_api_error(self, mock_drive_service, mock_slides_service, fn, kwargs, mock_path, msg):
+        """Test the tool returns the API error message."""
+        # files.* calls go to the Drive client, everything else to Slides
+        service = (mock_drive_service if mock_path.startswith('files.') else mock_slides_service)[0]
+
+        node = service
+        for name in mock_path.split('.'):
+            node = getattr(node, name).return_value
+        node.execute.side_effect = Exception(msg)
+
+        result = fn(**kwargs)
+
+        assert msg in result
@@ -0,0 +1,48 @@
+"""
+Tests for the create_presentation Slides tool in google_cloud_mcp.server.
+"""
+
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+create_presentation = server.create_presentation.fn
+
+
+class TestCreatePresentation:
+    """Test suite for create_presentation function."""
+
+    def test_create_presentation_success(self, mock_slides_service):
+        """Test successful presentation creation."""
+        service, mock_build = mock_slides_service
+
+        # Mock the API response using return_value chaining
+        mock_pres = {'presentationId': 'test-pres-123'}
+        service.presentations.return_value.create.return_value.execute.return_value = mock_pres
+
+        result = create_presentation(title="Test Presentation")
+
+        # Verify the build call
+        mock_build.assert_called_once_with('slides', 'v1', credentials=mock_build.call_args[1]['credentials'])
+
+        # Verify the API call
+        service.presentations.return_value.create.assert_called_once_with(body={'title': 'Test Presentation'})
+        service.presentations.return_value.create.return_value.execute.assert_called_once()
+
+        # Verify the result
+        assert all(n in result for n in (
+            "Presentation created",
+            "https://docs.google.com/presentation/d/test-pres-123/edit",
+        )), result
+
+    def test_create_presentation_with_empty_title(self, mock_slides_service):
+        """Test presentation creation with empty title."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {'presentationId': 'test-pres-456'}
+        service.presentations.return_value.create.return_value.execute.return_value = mock_pres
+
+        result = create_presentation(title="")
+
+        # Verify the API call with empty title
+        service.presentations.return_value.create.assert_called_once_with(body={'title': ''})
+        assert "Presentation created" in result
@@ -0,0 +1,81 @@
+"""
+Tests for the delete_slide Slides tool in google_cloud_mcp.server.
+"""
+
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+delete_slide = server.delete_slide.fn
+
+
+class TestDeleteSlide:
+    """Test suite for delete_slide function."""
+
+    def test_delete_slide_success(self, mock_slides_service, three_slide_pres):
+        """Test successfully deleting a slide."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = three_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = delete_slide(presentation_id="test-pres-123", slide_index=1)
+
+        # Verify batchUpdate was called with correct deleteObject request
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        assert batch_call_args[1]['presentationId'] == 'test-pres-123'
+
+        requests = batch_call_args[1]['body']['requests']
+        assert len(requests) == 1
+        assert 'deleteObject' in requests[0]
+        assert requests[0]['deleteObject']['objectId'] == 'slide-2'
+
+        assert "Slide 2 deleted" in result
+
+    def test_delete_slide_first_slide(self, mock_slides_service, two_slide_pres):
+        """Test deleting the first slide."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = two_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = delete_slide(presentation_id="test-pres-123", slide_index=0)
+
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        requests = batch_call_args[1]['body']['requests']
+        assert requests[0]['deleteObject']['objectId'] == 'slide-1'
+        assert "Slide 1 deleted" in result
+
+    def test_delete_slide_last_slide(self, mock_slides_service, three_slide_pres):
+        """Test deleting the last slide."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = three_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = delete_slide(presentation_id="test-pres-123", slide_index=2)
+
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        requests = batch_call_args[1]['body']['requests']
+        assert requests[0]['deleteObject']['objectId'] == 'slide-3'
+
+    def test_delete_slide_index_out_of_range(self, mock_slides_service, two_slide_pres):
+        """Test deleting slide with invalid index."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = two_slide_pres
+
+        result = delete_slide(presentation_id="test-pres-123", slide_index=5)
+
+        assert all(n in result for n in ("Slide index 5 out of range", "total: 2")), result
+        service.presentations.return_value.batchUpdate.assert_not_called()
+
+    def test_delete_slide_empty_presentation(self, mock_slides_service):
+        """Test deleting slide from empty presentation."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {'slides': []}
+        service.presentations.return_value.get.return_value.execute.return_value = mock_pres
+
+        result = delete_slide(presentation_id="test-pres-123", slide_index=0)
+
+        assert all(n in result for n in ("Slide index 0 out of range", "total: 0")), result
@@ -0,0 +1,119 @@
+"""
+Edge cases and integration scenarios for the Slides tools in google_cloud_mcp.server.
+"""
+
+from googleapiclient import discovery
+from google_cloud_mcp import server
+
+from .payloads import COMPLEX_PRES, LARGE_PRES
+
+# Extract the actual functions from the FunctionTool wrappers
+create_presentation = server.create_presentation.fn
+get_presentation = server.get_presentation.fn
+add_text_to_slide = server.add_text_to_slide.fn
+
+
+class TestEdgeCases:
+    """Test suite for edge cases and integration scenarios."""
+
+    def test_unicode_text_handling(self, mock_slides_service):
+        """Test handling of unicode characters in text."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {
+            'slides': [{'objectId': 'slide-1'}]
+        }
+        service.presentations.return_value.get.return_value.execute.return_value = mock_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        unicode_text = "Hello 世界 🌍 Café"
+        result = add_text_to_slide(
+            presentation_id="test-pres-123",
+            slide_index=0,
+            text=unicode_text
+        )
+
+        batch_call_args = service.presentations.return_value.batchUpdate.call_args
+        insert_text = batch_call_args[1]['body']['requests'][1]['insertText']
+        assert insert_text['text'] == unicode_text
+
+    def test_large_presentation_handling(self, mock_slides_service):
+        """Test handling presentation with many slides."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = LARGE_PRES
+
+        result = get_presentation(presentation_id="test-pres-large")
+
+        assert all(n in result for n in ("Title: Large Presentation", "Slides: 100")), result
+
+    def test_special_characters_in_title(self, mock_slides_service):
+        """Test creating presentation with special characters in title."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {'presentationId': 'test-pres-special'}
+        service.presentations.return_value.create.return_value.execute.return_value = mock_pres
+
+        special_title = "Q&A: \"What's Next?\" <2024>"
+        result = create_presentation(title=special_title)
+
+        service.presentations.return_value.create.assert_called_once_with(body={'title': special_title})
+        assert "Presentation created" in result
+
+    def test_presentation_with_complex_nested_elements(self, mock_slides_service):
+        """Test presentation with deeply nested text elements."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = COMPLEX_PRES
+
+        result = get_presentation(presentation_id="test-pres-complex")
+
+        assert "Slide 1: Line 1 | Line 2" in result
+
+    def test_zero_dimensions_text_box(self, mock_slides_service):
+        """Test adding text box with zero dimensions."""
+        service, mock_build = mock_slides_service
+
+        mock_pres = {
+            'slides': [{'objectId': 'slide-1'}]
+        }
+        service.presentations.return_value.get.return_value.execute.return_value = mock_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        result = add_text_to_slide(
+            presentation_id="test-pres-123",
+            slide_index=0,
+            text="Zero size",
+            x=0,
+            y=0,
+            width=0,
+            height=0
+        )
+
+        # Should still call the API (API might handle it or error)
+        assert "Text box added" in result
+
+    def test_slides_client_reused_across_tools(self, mock_slides_service, two_slide_pres):
+        """Test consecutive Slides tool calls share one cached client."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = two_slide_pres
+        service.presentations.return_value.batchUpdate.return_value.execute.return_value = {}
+
+        get_presentation(presentation_id="test-pres-123")
+        add_text_to_slide(presentation_id="test-pres-123", slide_index=1, text="Again")
+
+        # One Drive client for the freshness check, one Slides client for both tools
+        assert [c.args for c in mock_build.call_args_list] == [('drive', 'v3'), ('slides', 'v1')]
+
+
+# These two run in order: the build patch from the first must not outlive it.
+def test_build_patched_for_fixture_user(mock_slides_service):
+    """Test the Slides fixture patches build while the test runs."""
+    service, mock_build = mock_slides_service
+    assert server.build is mock_build
+
+
+def test_build_restored_without_fixture():
+    """Test a test that asks for no mock service sees the real build."""
+    assert server.build is discovery.build
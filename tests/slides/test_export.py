@@ -0,0 +1,322 @@
+"""
+Tests for the export_presentation Slides tool in google_cloud_mcp.server.
+"""
+
+import asyncio
+import threading
+import pytest
+from concurrent.futures import Future
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+export_presentation = server.export_presentation.fn
+
+_PDF_CONTENT = b'%PDF-1.4 fake pdf content'
+_PPTX_CONTENT = b'PK fake pptx content'
+# Both payloads encode to less than the 200-character excerpt, so the whole
+# base64 string appears and the result can be compared exactly.
+_PDF_EXPECTED = "✅ Exported as pdf (base64, 25 bytes):\nJVBERi0xLjQgZmFrZSBwZGYgY29udGVudA==..."
+_PPTX_EXPECTED = "✅ Exported as pptx (base64, 20 bytes):\nUEsgZmFrZSBwcHR4IGNvbnRlbnQ=..."
+
+
+class TestExportPresentation:
+    """Test suite for export_presentation function."""
+
+    def test_export_presentation_pdf(self, mock_drive_service, media_download):
+        """Test exporting presentation as PDF."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = _PDF_CONTENT
+
+        result = export_presentation(presentation_id="test-pres-123", format="pdf")
+
+        # Verify Drive API build
+        mock_build.assert_called_once_with('drive', 'v3', credentials=mock_build.call_args[1]['credentials'])
+
+        # Verify export call
+        export_call_args = service.files.return_value.export_media.call_args
+        assert export_call_args[1]['fileId'] == 'test-pres-123'
+        assert export_call_args[1]['mimeType'] == 'application/pdf'
+
+        # Verify result carries the base64 encoded content
+        assert result == _PDF_EXPECTED
+
+    def test_export_presentation_pptx(self, mock_drive_service, media_download):
+        """Test exporting presentation as PPTX."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = _PPTX_CONTENT
+
+        result = export_presentation(presentation_id="test-pres-123", format="pptx")
+
+        export_call_args = service.files.return_value.export_media.call_args
+        assert export_call_args[1]['mimeType'] == 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+        assert result == _PPTX_EXPECTED
+
+    def test_export_presentation_txt(self, mock_drive_service, media_download):
+        """Test exporting presentation as TXT."""
+        service, mock_build = mock_drive_service
+
+        txt_content = b'Slide 1: Title\nSlide 2: Content'
+        media_download.content = txt_content
+
+        result = export_presentation(presentation_id="test-pres-123", format="txt")
+
+        export_call_args = service.files.return_value.export_media.call_args
+        assert export_call_args[1]['mimeType'] == 'text/plain'
+
+        # TXT should be returned as decoded text, not base64
+        assert result == 'Slide 1: Title\nSlide 2: Content'
+
+    def test_export_presentation_txt_utf8(self, mock_drive_service, media_download):
+        """Test TXT exports are decoded as UTF-8."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = 'Café 世界'.encode('utf-8')
+
+        result = export_presentation(presentation_id="test-pres-123", format="txt")
+
+        assert result == 'Café 世界'
+
+    def test_export_presentation_large_file_preview(self, mock_drive_service, media_download):
+        """Test large binary exports report their full size but only a short excerpt."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = b'x' * 5_000_000
+
+        result = export_presentation(presentation_id="test-pres-123", format="pptx")
+
+        header, excerpt = result.split("\n")
+        assert header == "✅ Exported as pptx (base64, 5000000 bytes):"
+        assert len(excerpt) == 203
+
+    def test_export_presentation_streams_chunks(self, mock_drive_service, media_download):
+        """Test the export is read chunk by chunk through export_media, never a buffered export()."""
+        service, mock_build = mock_drive_service
+
+        media_download.chunks = [b'Slide 1', b' | Slide 2', b' | Slide 3']
+
+        result = export_presentation(presentation_id="test-pres-123", format="txt")
+
+        assert result == 'Slide 1 | Slide 2 | Slide 3'
+        assert media_download.call_args[1]['chunksize'] == server.EXPORT_CHUNK_SIZE
+        service.files.return_value.export.assert_not_called()
+
+    def test_export_presentation_unsupported_format(self, mock_drive_service):
+        """Test exporting with unsupported format."""
+        service, mock_build = mock_drive_service
+
+        result = export_presentation(presentation_id="test-pres-123", format="docx")
+
+        assert result == "❌ Unsupported format 'docx'. Use: pdf, pptx, txt"
+        service.files.return_value.export_media.assert_not_called()
+
+    def test_export_presentation_invalid_format(self, mock_drive_service):
+        """Test exporting with invalid format."""
+        service, mock_build = mock_drive_service
+
+        result = export_presentation(presentation_id="test-pres-123", format="invalid")
+
+        assert "Unsupported format 'invalid'" in result
+        service.files.return_value.export_media.assert_not_called()
+
+    def test_export_presentation_default_format(self, mock_drive_service, media_download):
+        """Test exporting with default format (pdf)."""
+        service, mock_build = mock_drive_service
+
+        pdf_content = b'PDF content'
+        media_download.content = pdf_content
+
+        result = export_presentation(presentation_id="test-pres-123")
+
+        export_call_args = service.files.return_value.export_media.call_args
+        assert export_call_args[1]['mimeType'] == 'application/pdf'
+
+    def test_export_presentation_format_case_insensitive(self, mock_drive_service, media_download):
+        """Test the format name is matched case-insensitively."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = _PDF_CONTENT
+
+        result = export_presentation(presentation_id="test-pres-123", format="PDF")
+
+        assert service.files.return_value.export_media.call_args[1]['mimeType'] == 'application/pdf'
+        assert result == _PDF_EXPECTED
+
+    def test_export_presentation_api_error(self, mock_drive_service, media_download):
+        """Test export_presentation with API error."""
+        service, mock_build = mock_drive_service
+
+        media_download.error = Exception("Export failed")
+
+        result = export_presentation(presentation_id="test-pres-123", format="pdf")
+
+        assert "Export failed" in result
+
+
+class TestExportPresentationCache:
+    """Test suite for the export_presentation result cache."""
+
+    @pytest.fixture
+    def drive_export(self, mock_drive_service, media_download):
+        """Drive service whose file reports a fixed modifiedTime and exports _PDF_CONTENT."""
+        service, _ = mock_drive_service
+        service.files.return_value.get.return_value.execute.return_value = {'modifiedTime': '2024-01-01T00:00:00Z'}
+        media_download.content = _PDF_CONTENT
+        return service
+
+    def test_cache_hit_skips_download(self, drive_export, media_download):
+        """Test an unchanged presentation is exported only once."""
+        first = export_presentation(presentation_id="test-pres-123", format="pdf")
+        second = export_presentation(presentation_id="test-pres-123", format="pdf")
+
+        assert first == second == _PDF_EXPECTED
+        drive_export.files.return_value.export_media.assert_called_once()
+        drive_export.files.return_value.get.assert_called_with(fileId='test-pres-123', fields='modifiedTime')
+
+    def test_cache_keyed_by_format(self, drive_export, media_download):
+        """Test each format is cached separately."""
+        export_presentation(presentation_id="test-pres-123", format="pdf")
+        export_presentation(presentation_id="test-pres-123", format="pptx")
+
+        assert drive_export.files.return_value.export_media.call_count == 2
+
+    def test_cache_miss_after_modification(self, drive_export, media_download):
+        """Test a new modifiedTime downloads the export again."""
+        export_presentation(presentation_id="test-pres-123", format="txt")
+        drive_export.files.return_value.get.return_value.execute.return_value = {'modifiedTime': '2024-01-02T00:00:00Z'}
+        media_download.content = b'Edited'
+
+        result = export_presentation(presentation_id="test-pres-123", format="txt")
+
+        assert result == 'Edited'
+
+    def test_cache_bounded_by_bytes(self, drive_export, media_download, monkeypatch):
+        """Test large exports evict older entries once PRESENTATION_CACHE_BYTES is reached."""
+        monkeypatch.setattr(server, "PRESENTATION_CACHE_BYTES", 10)
+        media_download.content = b'x' * 6
+
+        export_presentation(presentation_id="pres-a", format="txt")
+        export_presentation(presentation_id="pres-b", format="txt")
+
+        assert [k[0] for k in server._pres_cache] == ["pres-b"]
+
+    def test_oversize_export_not_cached(self, drive_export, media_download, monkeypatch):
+        """Test an export larger than PRESENTATION_CACHE_BYTES is returned but never stored."""
+        monkeypatch.setattr(server, "PRESENTATION_CACHE_BYTES", 10)
+        media_download.content = b'small'
+        export_presentation(presentation_id="pres-a", format="txt")
+        media_download.content = b'x' * 11
+
+        assert export_presentation(presentation_id="pres-b", format="txt") == 'x' * 11
+        assert [k[0] for k in server._pres_cache] == ["pres-a"]
+
+
+class _Interrupted(BaseException):
+    """Stands in for KeyboardInterrupt / CancelledError escaping the owner."""
+
+
+@pytest.fixture
+def parked(monkeypatch):
+    """Event set once a caller starts waiting on an in-flight export's future."""
+    event = threading.Event()
+
+    class ObservedFuture(Future):
+        def result(self, timeout=None):
+            event.set()
+            return super().result(timeout)
+
+    monkeypatch.setattr(server, "Future", ObservedFuture)
+    return event
+
+
+def _coalesce_pair(parked, owner_fn):
+    """Run an owner and a second same-key caller; the owner finishes only once the caller is parked.
+
+    Returns ``(owner_outcome, waiter_outcome, waiter_ran)``, where each outcome
+    is the returned value or the raised exception.
+    """
+    entered, release = threading.Event(), threading.Event()
+    outcomes = {}
+    waiter_ran = []
+
+    def owner_body():
+        entered.set()
+        release.wait(5)
+        return owner_fn()
+
+    def call(name, fn):
+        try:
+            outcomes[name] = server._coalesced('k', fn)
+        except BaseException as e:
+            outcomes[name] = e
+
+    owner = threading.Thread(target=call, args=('owner', owner_body), daemon=True)
+    owner.start()
+    assert entered.wait(5)
+    waiter = threading.Thread(target=call, args=('waiter', lambda: waiter_ran.append(True)), daemon=True)
+    waiter.start()
+
+    # Hold the owner until the waiter has joined the in-flight future
+    assert parked.wait(5), "waiter never waited on the in-flight future"
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+    assert not waiter.is_alive()
+    return outcomes['owner'], outcomes['waiter'], waiter_ran
+
+
+class TestExportCoalescing:
+    """Test suite for sharing in-flight exports between concurrent callers."""
+
+    def test_concurrent_callers_share_one_run(self, parked):
+        """Test a second caller with the same key waits for the first run instead of starting its own."""
+        owner, waiter, waiter_ran = _coalesce_pair(parked, lambda: 'exported')
+
+        assert owner == waiter == 'exported'
+        assert waiter_ran == []
+        assert server._in_flight == {}
+
+    def test_failure_shared_then_cleared(self, parked):
+        """Test waiters see the owner's error and the key is free for the next call."""
+        def boom():
+            raise RuntimeError("Export failed")
+
+        owner, waiter, waiter_ran = _coalesce_pair(parked, boom)
+
+        assert isinstance(owner, RuntimeError)
+        assert waiter is owner
+        assert waiter_ran == []
+        assert server._coalesced('k', lambda: 'retried') == 'retried'
+
+    def test_base_exception_releases_waiters(self, parked):
+        """Test an owner interrupted by a BaseException still resolves the shared future."""
+        def interrupted():
+            raise _Interrupted()
+
+        owner, waiter, waiter_ran = _coalesce_pair(parked, interrupted)
+
+        assert isinstance(owner, _Interrupted)
+        assert waiter is owner
+        assert server._in_flight == {}
+
+    def test_duplicate_ids_in_batch_export_once(self, mock_drive_service, media_download, parked, monkeypatch):
+        """Test a batch naming the same deck twice downloads it once, with the result cache out of the way."""
+        service, mock_build = mock_drive_service
+        service.files.return_value.get.return_value.execute.return_value = {'modifiedTime': '2024-01-01T00:00:00Z'}
+        media_download.content = b'Slide text'
+        monkeypatch.setattr(server, "_cached_result", lambda key: None)
+        monkeypatch.setattr(server, "_store_result", lambda key, result: None)
+
+        def export_media(fileId, mimeType):
+            # Keep the first download in flight until the duplicate is waiting on it
+            parked.wait(5)
+            return fileId
+
+        service.files.return_value.export_media.side_effect = export_media
+
+        result = asyncio.run(server.export_presentations_batch.fn(presentation_ids=['pres-1', 'pres-1'], format="txt"))
+
+        assert result.count("Slide text") == 2
+        service.files.return_value.export_media.assert_called_once()
@@ -0,0 +1,107 @@
+"""
+Tests for the export_presentations_batch Slides tool in google_cloud_mcp.server.
+"""
+
+import asyncio
+import threading
+import time
+from google_cloud_mcp import server
+
+# Extract the actual functions from the FunctionTool wrappers
+export_presentations_batch = server.export_presentations_batch.fn
+
+_IDS = ['pres-1', 'pres-2', 'pres-3', 'pres-4']
+
+
+class TestExportPresentationsBatch:
+    """Test suite for export_presentations_batch function."""
+
+    def test_export_batch_txt(self, mock_drive_service, media_download):
+        """Test every presentation is exported and reported in input order."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = b'Slide text'
+
+        result = asyncio.run(export_presentations_batch(presentation_ids=_IDS, format="txt"))
+
+        assert result == "\n\n".join(f"📽️ {pid}:\nSlide text" for pid in _IDS)
+        exported = {c[1]['fileId'] for c in service.files.return_value.export_media.call_args_list}
+        assert exported == set(_IDS)
+
+    def test_export_batch_client_per_thread(self, mock_drive_service, media_download):
+        """Test each worker thread builds one Drive client and reuses it for later exports."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = b'%PDF'
+        route = mock_build.side_effect
+        builders = []
+
+        def build_service(*args, **kwargs):
+            builders.append(threading.get_ident())
+            return route(*args, **kwargs)
+
+        mock_build.side_effect = build_service
+
+        asyncio.run(export_presentations_batch(presentation_ids=[f'pres-{i}' for i in range(10)]))
+
+        assert len(builders) == len(set(builders))
+
+    def test_export_batch_error_isolated(self, mock_drive_service, media_download):
+        """Test a failing presentation does not abort the rest of the batch."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = b'Slide text'
+
+        def export_media(fileId, mimeType):
+            if fileId == 'pres-2':
+                raise Exception("File not found: pres-2")
+            return fileId
+
+        service.files.return_value.export_media.side_effect = export_media
+
+        result = asyncio.run(export_presentations_batch(presentation_ids=_IDS, format="txt"))
+
+        assert "📽️ pres-2:\nFile not found: pres-2" in result
+        assert result.count("Slide text") == 3
+
+    def test_export_batch_bounded_workers(self, mock_drive_service, media_download):
+        """Test no more than EXPORT_WORKERS exports run at once."""
+        service, mock_build = mock_drive_service
+
+        media_download.content = b'Slide text'
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def export_media(fileId, mimeType):
+            with lock:
+                active.append(fileId)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(fileId)
+            return fileId
+
+        service.files.return_value.export_media.side_effect = export_media
+
+        asyncio.run(export_presentations_batch(presentation_ids=[f'pres-{i}' for i in range(10)], format="txt"))
+
+        assert max(peak) <= server.EXPORT_WORKERS
+
+    def test_export_batch_unsupported_format(self, mock_drive_service):
+        """Test an unsupported format is rejected before any export."""
+        service, mock_build = mock_drive_service
+
+        result = asyncio.run(export_presentations_batch(presentation_ids=_IDS, format="docx"))
+
+        assert result == "❌ Unsupported format 'docx'. Use: pdf, pptx, txt"
+        mock_build.assert_not_called()
+
+    def test_export_batch_empty(self, mock_drive_service):
+        """Test an empty id list."""
+        service, mock_build = mock_drive_service
+
+        result = asyncio.run(export_presentations_batch(presentation_ids=[]))
+
+        assert result == "No presentations to export."
+        mock_build.assert_not_called()
@@ -0,0 +1,196 @@
+"""
+Tests for the get_presentation Slides tool in google_cloud_mcp.server.
+"""
+
+import re
+import pytest
+from google_cloud_mcp import server
+
+from .payloads import TWO_SLIDE_PRES, NESTED_PRES, IMAGE_PRES, EMPTY_SLIDE_PRES
+
+# Extract the actual functions from the FunctionTool wrappers
+get_presentation = server.get_presentation.fn
+
+# One ordered match also pins the line order
+_GET_PRES_RE = re.compile(
+    r"Title: My Presentation.*Slides: 2.*Slide 1: Title Slide \| Subtitle.*Slide 2: Content Slide",
+    re.S,
+)
+_EMPTY_PRES_RE = re.compile(r"Title: Empty Presentation.*Slides: 1.*Slide 1: \(empty\)", re.S)
+
+
+class TestGetPresentation:
+    """Test suite for get_presentation function."""
+
+    def test_get_presentation_success(self, mock_drive_service, mock_slides_service):
+        """Test successful retrieval of presentation metadata."""
+        drive, _ = mock_drive_service
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = TWO_SLIDE_PRES
+
+        result = get_presentation(presentation_id="test-pres-123")
+
+        # Verify the API call
+        assert [c.args for c in mock_build.call_args_list] == [('drive', 'v3'), ('slides', 'v1')]
+        drive.files.return_value.get.assert_called_once_with(fileId='test-pres-123', fields='modifiedTime')
+        service.files.assert_not_called()
+        drive.presentations.assert_not_called()
+        service.presentations.return_value.get.assert_called_once_with(presentationId='test-pres-123', fields=server._SUMMARY_FIELDS)
+        service.presentations.return_value.get.return_value.execute.assert_called_once()
+
+        # Verify the result
+        assert _GET_PRES_RE.search(result), result
+
+    def test_get_presentation_empty_slides(self, mock_slides_service):
+        """Test retrieval of presentation with empty slides."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = EMPTY_SLIDE_PRES
+
+        result = get_presentation(presentation_id="test-pres-456")
+
+        assert _EMPTY_PRES_RE.search(result), result
+
+    def test_get_presentation_nested_text_extraction(self, mock_slides_service):
+        """Test text extraction from nested structures."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = NESTED_PRES
+
+        result = get_presentation(presentation_id="test-pres-789")
+
+        assert "Slide 1: Text 1 | Text 2 | Text 3" in result
+
+    def test_get_presentation_no_text_elements(self, mock_slides_service):
+        """Test presentation with shapes but no text."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = IMAGE_PRES
+
+        result = get_presentation(presentation_id="test-pres-img")
+
+        assert "Slide 1: (empty)" in result
+
+    def test_get_presentation_skips_non_text_runs(self, mock_slides_service):
+        """Test paragraph markers and auto text are left out of the slide summary."""
+        service, mock_build = mock_slides_service
+
+        service.presentations.return_value.get.return_value.execute.return_value = {
+            'title': 'Markers',
+            'slides': [{'pageElements': [{'shape': {'text': {'textElements': [
+                {'paragraphMarker': {'style': {}}},
+                {'textRun': {'content': 'Agenda\n'}},
+                {'autoText': {'type': 'SLIDE_NUMBER', 'content': '1'}},
+            ]}}}]}]
+        }
+
+        result = get_presentation(presentation_id="test-pres-markers")
+
+        assert result == "Title: Markers\nSlides: 1\n  Slide 1: Agenda"
+
+    def test_get_presentation_text_only(self, mock_drive_service, mock_slides_service, media_download):
+        """Test text_only returns Drive's plain-text export without fetching the presentation."""
+        drive, _ = mock_drive_service
+        service, mock_build = mock_slides_service
+
+        media_download.content = b'Agenda\nQ1 results'
+
+        result = get_presentation(presentation_id="test-pres-123", text_only=True)
+
+        assert result == 'Agenda\nQ1 results'
+        drive.files.return_value.export_media.assert_called_once_with(fileId='test-pres-123', mimeType='text/plain')
+        service.presentations.return_value.get.assert_not_called()
+
+
+class TestGetPresentationCache:
+    """Test suite for the get_presentation summary cache."""
+
+    @pytest.fixture
+    def slides_get(self, mock_drive_service, mock_slides_service):
+        """``(drive, slides)`` services: Drive reports a fixed modifiedTime, Slides returns TWO_SLIDE_PRES."""
+        drive, _ = mock_drive_service
+        service, _ = mock_slides_service
+        drive.files.return_value.get.return_value.execute.return_value = {'modifiedTime': '2024-01-01T00:00:00Z'}
+        service.presentations.return_value.get.return_value.execute.return_value = TWO_SLIDE_PRES
+        return drive, service
+
+    def test_cache_hit_skips_slides_fetch(self, slides_get):
+        """Test an unchanged presentation is served from the cache."""
+        drive, slides = slides_get
+
+        first = get_presentation(presentation_id="test-pres-123")
+        second = get_presentation(presentation_id="test-pres-123")
+
+        assert first == second
+        slides.presentations.return_value.get.assert_called_once()
+        assert drive.files.return_value.get.call_count == 2
+
+    def test_cache_miss_after_modification(self, slides_get):
+        """Test a new modifiedTime refetches the presentation."""
+        drive, slides = slides_get
+
+        get_presentation(presentation_id="test-pres-123")
+        drive.files.return_value.get.return_value.execute.return_value = {'modifiedTime': '2024-01-02T00:00:00Z'}
+        slides.presentations.return_value.get.return_value.execute.return_value = EMPTY_SLIDE_PRES
+
+        result = get_presentation(presentation_id="test-pres-123")
+
+        assert "Title: Empty Presentation" in result
+        assert slides.presentations.return_value.get.call_count == 2
+
+    def test_cache_entry_expires(self, slides_get, monkeypatch):
+        """Test entries older than PRESENTATION_CACHE_TTL are refetched."""
+        _, slides = slides_get
+
+        now = [1000.0]
+        monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+
+        get_presentation(presentation_id="test-pres-123")
+        now[0] += server.PRESENTATION_CACHE_TTL
+        get_presentation(presentation_id="test-pres-123")
+
+        assert slides.presentations.return_value.get.call_count == 2
+
+    def test_cache_evicts_oldest(self, slides_get, monkeypatch):
+        """Test the cache stays within PRESENTATION_CACHE_SIZE entries."""
+        monkeypatch.setattr(server, "PRESENTATION_CACHE_SIZE", 2)
+
+        for pid in ("pres-a", "pres-b", "pres-c"):
+            get_presentation(presentation_id=pid)
+
+        assert [k[0] for k in server._pres_cache] == ["pres-b", "pres-c"]
+
+    def test_cache_evicts_least_recently_used(self, slides_get, monkeypatch):
+        """Test a cache hit keeps an entry ahead of ones stored after it."""
+        monkeypatch.setattr(server, "PRESENTATION_CACHE_SIZE", 2)
+
+        for pid in ("pres-a", "pres-b", "pres-a", "pres-c"):
+            get_presentation(presentation_id=pid)
+
+        assert [k[0] for k in server._pres_cache] == ["pres-a", "pres-c"]
+
+    def test_cache_evicts_expired_first(self, slides_get, monkeypatch):
+        """Test expired entries are dropped before a live least recently used one."""
+        monkeypatch.setattr(server, "PRESENTATION_CACHE_SIZE", 2)
+        now = [1000.0]
+        monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+
+        get_presentation(presentation_id="pres-a")
+        now[0] += server.PRESENTATION_CACHE_TTL / 2
+        get_presentation(presentation_id="pres-b")
+        get_presentation(presentation_id="pres-a")
+        now[0] += server.PRESENTATION_CACHE_TTL / 2
+        get_presentation(presentation_id="pres-c")
+
+        assert [k[0] for k in server._pres_cache] == ["pres-b", "pres-c"]
+
+    def test_errors_not_cached(self, slides_get):
+        """Test a failed fetch is retried on the next call."""
+        _, slides = slides_get
+
+        execute = slides.presentations.return_value.get.return_value.execute
+        execute.side_effect = [Exception("Backend error"), TWO_SLIDE_PRES]
+
+        assert get_presentation(presentation_id="test-pres-123") == "Backend error"
+        assert "Title: My Presentation" in get_presentation(presentation_id="test-pres-123")
@@ -0,0 +1,107 @@
+"""
+Tests for the get_presentations_batch Slides tool in google_cloud_mcp.server.
+"""
+
+import pytest
+from google_cloud_mcp import server
+
+from .payloads import TWO_SLIDE_PRES, EMPTY_SLIDE_PRES
+
+# Extract the actual functions from the FunctionTool wrappers
+get_presentations_batch = server.get_presentations_batch.fn
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each added call from ``responses``."""
+
+    def __init__(self, responses, callback):
+        self.responses = responses
+        self.callback = callback
+        self.ids = []
+
+    def add(self, request, request_id):
+        self.ids.append(request_id)
+
+    def execute(self):
+        for rid in self.ids:
+            resp = self.responses[rid]
+            if isinstance(resp, Exception):
+                self.callback(rid, None, resp)
+            else:
+                self.callback(rid, resp, None)
+
+
+@pytest.fixture
+def batches(mock_slides_service):
+    """Route new_batch_http_request to FakeBatch; fill ``responses`` per test."""
+    service, _ = mock_slides_service
+    created = []
+    responses = {}
+
+    def new_batch(callback):
+        created.append(FakeBatch(responses, callback))
+        return created[-1]
+
+    service.new_batch_http_request.side_effect = new_batch
+    return created, responses
+
+
+class TestGetPresentationsBatch:
+    """Test suite for get_presentations_batch function."""
+
+    def test_get_batch_success(self, mock_slides_service, batches):
+        """Test each presentation is summarised in input order from one batch call."""
+        service, mock_build = mock_slides_service
+        created, responses = batches
+        responses.update({'pres-a': TWO_SLIDE_PRES, 'pres-b': EMPTY_SLIDE_PRES})
+
+        result = get_presentations_batch(presentation_ids=['pres-a', 'pres-b'])
+
+        assert len(created) == 1
+        first, second = result.split("\n\n")
+        assert first.startswith("📽️ pres-a:\nTitle: My Presentation")
+        assert second.startswith("📽️ pres-b:\nTitle: Empty Presentation")
+        service.presentations.return_value.get.assert_any_call(presentationId='pres-b', fields=server._SUMMARY_FIELDS)
+
+    def test_get_batch_chunks_of_100(self, mock_slides_service, batches):
+        """Test ids are split into batch requests of at most BATCH_GET_LIMIT calls."""
+        service, mock_build = mock_slides_service
+        created, responses = batches
+        ids = [f'pres-{i}' for i in range(250)]
+        responses.update(dict.fromkeys(ids, EMPTY_SLIDE_PRES))
+
+        result = get_presentations_batch(presentation_ids=ids)
+
+        assert [len(b.ids) for b in created] == [100, 100, 50]
+        assert result.count("Title: Empty Presentation") == 250
+
+    def test_get_batch_error_isolated(self, mock_slides_service, batches):
+        """Test a failed call is reported inline without dropping the others."""
+        service, mock_build = mock_slides_service
+        created, responses = batches
+        responses.update({'pres-a': TWO_SLIDE_PRES, 'missing': Exception("Requested entity was not found.")})
+
+        result = get_presentations_batch(presentation_ids=['pres-a', 'missing'])
+
+        assert "📽️ missing:\nRequested entity was not found." in result
+        assert "Title: My Presentation" in result
+
+    def test_get_batch_duplicate_ids(self, mock_slides_service, batches):
+        """Test duplicate ids are fetched once, since batch request ids must be unique."""
+        service, mock_build = mock_slides_service
+        created, responses = batches
+        responses['pres-a'] = TWO_SLIDE_PRES
+
+        result = get_presentations_batch(presentation_ids=['pres-a', 'pres-a'])
+
+        assert created[0].ids == ['pres-a']
+        assert result.count("📽️ pres-a:") == 1
+
+    def test_get_batch_empty(self, mock_slides_service):
+        """Test an empty id list."""
+        service, mock_build = mock_slides_service
+
+        result = get_presentations_batch(presentation_ids=[])
+
+        assert result == "No presentations given."
+        mock_build.assert_not_called()
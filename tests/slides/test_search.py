@@ -0,0 +1,56 @@
+"""
+Tests for the search_presentations Slides tool in google_cloud_mcp.server.
+"""
+
+import pytest
+from google_cloud_mcp import server
+
+from .payloads import freeze
+
+# Extract the actual functions from the FunctionTool wrappers
+search_presentations = server.search_presentations.fn
+
+_PRES_MIME_Q = "mimeType='application/vnd.google-apps.presentation'"
+
+_PROJECT_FILES = freeze([
+    {'id': 'pres-1', 'name': 'Project Presentation', 'modifiedTime': '2024-01-15T10:00:00Z'},
+    {'id': 'pres-2', 'name': 'Project Update', 'modifiedTime': '2024-01-14T09:00:00Z'}
+])
+_RECENT_FILES = freeze([
+    {'id': 'pres-1', 'name': 'Recent Presentation', 'modifiedTime': '2024-01-15T10:00:00Z'}
+])
+
+
+class TestSearchPresentations:
+    """Test suite for search_presentations function."""
+
+    @pytest.mark.parametrize("query,max_results,files,expected_q,expected_in_result", [
+        # Query adds a fullText filter
+        ("Project", 20, _PROJECT_FILES, f"{_PRES_MIME_Q} and fullText contains 'Project'",
+         ("Project Presentation", "pres-1", "2024-01-15T10:00:00Z")),
+        # Empty query lists recent presentations with only the mimeType filter
+        ("", 10, _RECENT_FILES, _PRES_MIME_Q, ("Recent Presentation",)),
+        ("NonExistent", 20, (), f"{_PRES_MIME_Q} and fullText contains 'NonExistent'",
+         ("No presentations found",)),
+        ("Test", 50, (), f"{_PRES_MIME_Q} and fullText contains 'Test'", ()),
+    ], ids=["with_query", "empty_query", "no_results", "custom_max_results"])
+    def test_search_presentations(self, mock_drive_service, query, max_results, files,
+                                  expected_q, expected_in_result):
+        """Test the Drive query, paging and ordering, and the formatted result."""
+        service, mock_build = mock_drive_service
+
+        service.files.return_value.list.return_value.execute.return_value = {'files': files}
+
+        result = search_presentations(query=query, max_results=max_results)
+
+        # Verify the build call for Drive API
+        mock_build.assert_called_once_with('drive', 'v3', credentials=mock_build.call_args[1]['credentials'])
+
+        # Verify the query
+        list_kwargs = service.files.return_value.list.call_args[1]
+        assert list_kwargs['q'] == expected_q
+        assert list_kwargs['pageSize'] == max_results
+        assert list_kwargs['orderBy'] == 'modifiedTime desc'
+
+        # Verify the result
+        assert all(n in result for n in expected_in_result), result
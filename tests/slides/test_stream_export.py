@@ -0,0 +1,83 @@
+"""
+Tests for the stream_export helper in google_cloud_mcp.server.
+"""
+
+import asyncio
+import contextlib
+import threading
+import pytest
+from google_cloud_mcp import server
+
+stream_export = server.stream_export
+
+
+def collect(ids, format='pdf', limit=None):
+    """Run stream_export to completion (or ``limit`` items) and return the pairs.
+
+    The generator is closed inside the loop, as a long-lived consumer would,
+    rather than left for asyncio.run to cancel at shutdown.
+    """
+    async def run():
+        out = []
+        async with contextlib.aclosing(stream_export(ids, format)) as chunks:
+            async for item in chunks:
+                out.append(item)
+                if limit is not None and len(out) == limit:
+                    break
+        return out
+    return asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+
+class TestStreamExport:
+    """Test suite for stream_export function."""
+
+    def test_stream_export_yields_chunks_per_id(self, mock_drive_service, media_download):
+        """Test every chunk of every export is yielded, in order per presentation."""
+        service, mock_build = mock_drive_service
+
+        media_download.chunks = [b'a', b'b', b'c']
+        ids = [f'pres-{i}' for i in range(6)]
+        route = mock_build.side_effect
+        builders = []
+
+        def build_service(*args, **kwargs):
+            builders.append(threading.get_ident())
+            return route(*args, **kwargs)
+
+        mock_build.side_effect = build_service
+
+        pairs = collect(ids)
+
+        for pid in ids:
+            assert [c for p, c in pairs if p == pid] == [b'a', b'b', b'c']
+        # Worker threads reuse their cached Drive client across presentations
+        assert len(builders) == len(set(builders))
+
+    def test_stream_export_early_exit(self, mock_drive_service, media_download):
+        """Test stopping after the first chunk shuts the workers down instead of hanging."""
+        service, mock_build = mock_drive_service
+
+        media_download.chunks = [b'x'] * 50
+
+        pairs = collect([f'pres-{i}' for i in range(6)], limit=1)
+
+        assert len(pairs) == 1
+        # Exports still waiting for a worker slot never build a client
+        assert mock_build.call_count <= server.EXPORT_WORKERS
+
+    def test_stream_export_error_propagates(self, mock_drive_service, media_download):
+        """Test a failed download is raised to the consumer."""
+        service, mock_build = mock_drive_service
+
+        media_download.error = Exception("Export failed")
+
+        with pytest.raises(Exception, match="Export failed"):
+            collect(['pres-1'])
+
+    def test_stream_export_unsupported_format(self, mock_drive_service):
+        """Test an unsupported format is rejected before any download."""
+        service, mock_build = mock_drive_service
+
+        with pytest.raises(ValueError, match="Use: pdf, pptx, txt"):
+            collect(['pres-1'], format='docx')
+        mock_build.assert_not_called()
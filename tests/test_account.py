@@ -5,6 +5,7 @@ This module tests the account information retrieval functionality from Gmail API
 including successful retrieval, service configuration, error handling, and response format validation.
 """
 
+import threading
 import pytest
 from unittest.mock import patch, MagicMock
 from google_cloud_mcp import server
@@ -234,6 +235,49 @@ class TestGetAccountInfo:
         assert result1 == result2 == result3
         assert 'test@example.com' in result1
 
+        # The Gmail client is built once and reused
+        mock_build.assert_called_once()
+
+    def test_client_not_shared_across_threads(self, mock_gmail_service):
+        """
+        Test that each thread gets its own cached client.
+
+        httplib2 clients are not thread-safe, so a worker thread must not reuse
+        the client built on the main thread.
+        """
+        service, mock_build = mock_gmail_service
+        service.users.return_value.getProfile.return_value.execute.return_value = {
+            'emailAddress': 'test@example.com'
+        }
+
+        get_account_info()
+        worker = threading.Thread(target=get_account_info)
+        worker.start()
+        worker.join()
+        get_account_info()
+
+        assert mock_build.call_count == 2
+
+    def test_expired_credentials_rebuild_client(self, mock_gmail_service, mock_credentials):
+        """
+        Test that a cached client is rebuilt once its credentials can no longer refresh.
+
+        Verifies that get_credentials() and build() run again after expiry.
+        """
+        service, mock_build = mock_gmail_service
+        service.users.return_value.getProfile.return_value.execute.return_value = {
+            'emailAddress': 'test@example.com'
+        }
+
+        get_account_info()
+        creds = mock_credentials.return_value
+        creds.expired = True
+        creds.refresh_token = None
+        get_account_info()
+
+        assert mock_credentials.call_count == 2
+        assert mock_build.call_count == 2
+
     def test_service_build_receives_credentials(self, mock_credentials):
         """
         Test that the service build receives valid credentials.
@@ -794,6 +794,7 @@ class TestExportDocument:
         }
 
         for format_name, expected_mime in formats_and_mimes.items():
+            server._clear_service_cache()
             with patch('google_cloud_mcp.server.build') as mock_build:
                 mock_service = Mock()
                 mock_build.return_value = mock_service
@@ -7,12 +7,19 @@ Tests the following tools from google_cloud_mcp.server:
 - batch_update_spreadsheet: Batch update multiple ranges
 - add_sheet: Add a new sheet to a spreadsheet
 - export_spreadsheet: Export spreadsheet in various formats
+- search_and_export: Search and export the matches concurrently, with bounded workers
 """
 
+import asyncio
 import base64
+import copy
 import json
+import threading
+import time
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from types import MappingProxyType
+from unittest.mock import Mock, MagicMock, call
+from googleapiclient.discovery import build as discovery_build
 from googleapiclient.errors import HttpError
 
 from google_cloud_mcp import server
@@ -21,37 +28,123 @@ clear_spreadsheet_range = server.clear_spreadsheet_range.fn
 batch_update_spreadsheet = server.batch_update_spreadsheet.fn
 add_sheet = server.add_sheet.fn
 export_spreadsheet = server.export_spreadsheet.fn
+search_and_export = server.search_and_export.fn
+
+
+# Service mocks with the call chains used below already materialised.
+# Deep-copying one is cheaper than building a new MagicMock and walking
+# the chain again, and unlike reset_mock() it cannot leak stubbed return
+# values from one test into the next. Each is specced against the real
+# Resource built offline from the bundled discovery document, so a typo
+# like ``files`` -> ``file`` raises AttributeError instead of passing.
+def _prewire(template, *paths):
+    """Touch each dotted attribute path so the child mocks exist before deepcopy."""
+    for path in paths:
+        node = template
+        for name in path.split('.'):
+            node = getattr(node, name)
+    return template
+
+
+_DRIVE_TEMPLATE = _prewire(
+    MagicMock(spec_set=discovery_build('drive', 'v3', developerKey='test', static_discovery=True)),
+    'files.return_value.list.return_value',
+    'files.return_value.export_media',
+)
+
+_SHEETS_TEMPLATE = _prewire(
+    MagicMock(spec_set=discovery_build('sheets', 'v4', developerKey='test', static_discovery=True)),
+    'spreadsheets.return_value.batchUpdate.return_value',
+    'spreadsheets.return_value.values.return_value.clear.return_value',
+    'spreadsheets.return_value.values.return_value.batchUpdate.return_value',
+)
+
+
+@pytest.fixture(autouse=True)
+def patched_server(monkeypatch):
+    """Patch build/get_credentials on the server module for every test here."""
+    mock_build = MagicMock()
+    mock_creds = Mock()
+    monkeypatch.setattr(server, "build", mock_build)
+    monkeypatch.setattr(server, "get_credentials", lambda: mock_creds)
+    return mock_build, mock_creds
+
+
+@pytest.fixture(scope="module")
+def sample_search_payload():
+    """Read-only Drive files().list() response with two spreadsheets."""
+    return MappingProxyType({'files': (
+        MappingProxyType({
+            'id': 'spreadsheet-1',
+            'name': 'Sales Report 2024',
+            'mimeType': 'application/vnd.google-apps.spreadsheet',
+            'modifiedTime': '2024-02-10T14:30:00.000Z'
+        }),
+        MappingProxyType({
+            'id': 'spreadsheet-2',
+            'name': 'Budget Planning',
+            'mimeType': 'application/vnd.google-apps.spreadsheet',
+            'modifiedTime': '2024-02-11T11:20:00.000Z'
+        }),
+    )})
+
+
+@pytest.fixture(scope="module")
+def empty_search_payload():
+    """Read-only Drive files().list() response with no matches."""
+    return MappingProxyType({'files': ()})
+
+
+def make_http_error(status, msg):
+    """Build an HttpError carrying a Google-style JSON error body."""
+    content = f'{{"error": {{"code": {status}, "message": "{msg}"}}}}'.encode()
+    return HttpError(resp=Mock(status=status), content=content)
+
+
+CLEAR_ERROR_CASES = [(400, "Invalid range"), (404, "Spreadsheet not found")]
+ADD_SHEET_ERROR_CASES = [(400, "Sheet name already exists"), (404, "Spreadsheet not found")]
+EXPORT_ERROR_CASES = [(404, "File not found"), (403, "Permission denied")]
+
+# HttpError parses its content on construction, so build each one once and
+# reuse it; side_effect raises the same instance on every call.
+_HTTP_ERRORS = {
+    case: make_http_error(*case)
+    for case in (*CLEAR_ERROR_CASES, *ADD_SHEET_ERROR_CASES, *EXPORT_ERROR_CASES)
+}
+_ERR_403_FORBIDDEN = make_http_error(403, "Forbidden")
+_ERR_400_BATCH = make_http_error(400, "Invalid batch update data")
+_ERR_429 = make_http_error(429, "Rate limit exceeded")
+
+
+@pytest.fixture
+def mock_sleep(monkeypatch):
+    """Replace time.sleep so retry backoff returns immediately."""
+    sleep = Mock()
+    monkeypatch.setattr(server.time, "sleep", sleep)
+    return sleep
+
+# batch_update_spreadsheet payloads, serialised once at import time
+_BATCH_OK = (
+    '[{"range":"Sheet1!A1:B5","values":[["Header1","Header2"],["Value1","Value2"]]},'
+    '{"range":"Sheet2!C1:D10","values":[' + ','.join(['["Data","Data"]'] * 10) + ']}]'
+)
+_BATCH_MISSING_VALUES = '[{"range":"A1"}]'
+_BATCH_EMPTY = '[]'
+_BATCH_NEW_SHEET = '[{"range":"DataSheet!A1:B2","values":[["Header1","Header2"],["Value1","Value2"]]}]'
+_BATCH_10K = json.dumps([{'range': f'S!A{i}', 'values': [['x']]} for i in range(10_000)])
 
 
 class TestSearchSpreadsheets:
     """Test search_spreadsheets functionality."""
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_search_spreadsheets_success(self, mock_get_creds, mock_build):
+    def test_search_spreadsheets_success(self, patched_server, sample_search_payload):
         """Test successful spreadsheet search with results."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, mock_creds = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
 
-        mock_drive.files.return_value.list.return_value.execute.return_value = {
-            'files': [
-                {
-                    'id': 'spreadsheet-1',
-                    'name': 'Sales Report 2024',
-                    'mimeType': 'application/vnd.google-apps.spreadsheet',
-                    'modifiedTime': '2024-02-10T14:30:00.000Z'
-                },
-                {
-                    'id': 'spreadsheet-2',
-                    'name': 'Budget Planning',
-                    'mimeType': 'application/vnd.google-apps.spreadsheet',
-                    'modifiedTime': '2024-02-11T11:20:00.000Z'
-                }
-            ]
-        }
+        mock_drive.files.return_value.list.return_value.execute = Mock(return_value=sample_search_payload)
 
         result = search_spreadsheets(query="Sales", max_results=10)
 
@@ -61,25 +154,25 @@ class TestSearchSpreadsheets:
         call_kwargs = mock_drive.files.return_value.list.call_args[1]
         assert 'q' in call_kwargs
         assert 'application/vnd.google-apps.spreadsheet' in call_kwargs['q']
-        assert 'Sales' in call_kwargs['q']
+        assert "name contains 'Sales'" in call_kwargs['q']
         assert call_kwargs['pageSize'] == 10
+        # Only the fields used in the output are requested
+        assert call_kwargs['fields'] == 'files(id,name,modifiedTime)'
+        assert call_kwargs['orderBy'] == 'modifiedTime desc'
 
         # The actual function returns a formatted string
         assert 'Sales Report 2024' in result
         assert 'Budget Planning' in result
         assert 'spreadsheet-1' in result
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_search_spreadsheets_empty_query(self, mock_get_creds, mock_build):
+    def test_search_spreadsheets_empty_query(self, patched_server, empty_search_payload):
         """Test search with empty query returns all spreadsheets."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
 
-        mock_drive.files.return_value.list.return_value.execute.return_value = {'files': []}
+        mock_drive.files.return_value.list.return_value.execute = Mock(return_value=empty_search_payload)
 
         result = search_spreadsheets(query="", max_results=20)
 
@@ -88,60 +181,77 @@ class TestSearchSpreadsheets:
         assert "mimeType='application/vnd.google-apps.spreadsheet'" in call_kwargs['q']
         assert call_kwargs['pageSize'] == 20
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_search_spreadsheets_no_results(self, mock_get_creds, mock_build):
+    def test_search_spreadsheets_no_results(self, patched_server, empty_search_payload):
         """Test search with no results."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
 
-        mock_drive.files.return_value.list.return_value.execute.return_value = {'files': []}
+        mock_drive.files.return_value.list.return_value.execute = Mock(return_value=empty_search_payload)
 
         result = search_spreadsheets(query="NonexistentSpreadsheet", max_results=20)
 
         assert result == "No spreadsheets found."
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_search_spreadsheets_api_error(self, mock_get_creds, mock_build):
+    def test_search_spreadsheets_api_error(self, patched_server):
         """Test search handles API errors gracefully."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
 
-        error_content = b'{"error": {"code": 403, "message": "Forbidden"}}'
-        mock_drive.files.return_value.list.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=403),
-            content=error_content
-        )
+        mock_drive.files.return_value.list.return_value.execute = Mock(side_effect=_ERR_403_FORBIDDEN)
 
         # The actual function catches exceptions and returns error string
         result = search_spreadsheets(query="test", max_results=20)
         assert isinstance(result, str)
 
+    def test_search_retries_rate_limit(self, patched_server, mock_sleep, sample_search_payload):
+        """Test search backs off exponentially on 429 and then succeeds."""
+        mock_build, _ = patched_server
+
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
+        mock_build.return_value = mock_drive
+        execute = Mock(side_effect=[_ERR_429, _ERR_429, sample_search_payload])
+        mock_drive.files.return_value.list.return_value.execute = execute
+
+        result = search_spreadsheets(query="Sales")
+
+        assert execute.call_count == 3
+        assert mock_sleep.call_args_list == [call(1), call(2)]
+        assert 'Sales Report 2024' in result
+
+    def test_search_does_not_retry_client_error(self, patched_server, mock_sleep):
+        """Test non-retryable errors surface immediately."""
+        mock_build, _ = patched_server
+
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
+        mock_build.return_value = mock_drive
+        execute = Mock(side_effect=_ERR_403_FORBIDDEN)
+        mock_drive.files.return_value.list.return_value.execute = execute
+
+        result = search_spreadsheets(query="test")
+
+        assert execute.call_count == 1
+        mock_sleep.assert_not_called()
+        assert 'Forbidden' in result
+
 
 class TestClearSpreadsheetRange:
     """Test clear_spreadsheet_range functionality."""
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_clear_range_success(self, mock_get_creds, mock_build):
+    def test_clear_range_success(self, patched_server):
         """Test successful range clearing."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, mock_creds = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        mock_sheets.spreadsheets.return_value.values.return_value.clear.return_value.execute.return_value = {
+        mock_sheets.spreadsheets.return_value.values.return_value.clear.return_value.execute = Mock(return_value={
             'spreadsheetId': 'test-spreadsheet-id',
             'clearedRange': 'Sheet1!A1:B10'
-        }
+        })
 
         result = clear_spreadsheet_range(
             spreadsheet_id='test-spreadsheet-id',
@@ -153,88 +263,44 @@ class TestClearSpreadsheetRange:
         # The actual function returns a success string
         assert 'Cleared' in result or 'Sheet1!A1:B10' in result
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_clear_range_invalid_range(self, mock_get_creds, mock_build):
-        """Test clearing with invalid range."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+    @pytest.mark.parametrize("status,msg", CLEAR_ERROR_CASES)
+    def test_clear_range_error(self, patched_server, status, msg):
+        """Test clearing an invalid range or a non-existent spreadsheet."""
+        mock_build, _ = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        error_content = b'{"error": {"code": 400, "message": "Invalid range"}}'
-        mock_sheets.spreadsheets.return_value.values.return_value.clear.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=400),
-            content=error_content
-        )
+        mock_sheets.spreadsheets.return_value.values.return_value.clear.return_value.execute = \
+            Mock(side_effect=_HTTP_ERRORS[status, msg])
 
         # The actual function catches exceptions and returns error string
         result = clear_spreadsheet_range(
             spreadsheet_id='test-spreadsheet-id',
-            range='InvalidRange!!!'
-        )
-        assert isinstance(result, str)
-
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_clear_range_not_found(self, mock_get_creds, mock_build):
-        """Test clearing range in non-existent spreadsheet."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
-
-        mock_sheets = MagicMock()
-        mock_build.return_value = mock_sheets
-
-        error_content = b'{"error": {"code": 404, "message": "Spreadsheet not found"}}'
-        mock_sheets.spreadsheets.return_value.values.return_value.clear.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=404),
-            content=error_content
-        )
-
-        # The actual function catches exceptions and returns error string
-        result = clear_spreadsheet_range(
-            spreadsheet_id='nonexistent-id',
             range='Sheet1!A1:B10'
         )
-        assert isinstance(result, str)
+        assert str(status) in result
+        assert msg in result
 
 
 class TestBatchUpdateSpreadsheet:
     """Test batch_update_spreadsheet functionality."""
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_batch_update_success(self, mock_get_creds, mock_build):
+    def test_batch_update_success(self, patched_server):
         """Test successful batch update."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, mock_creds = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {
+        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute = Mock(return_value={
             'spreadsheetId': 'test-spreadsheet-id',
             'totalUpdatedCells': 45
-        }
-
-        batch_data = [
-            {
-                'range': 'Sheet1!A1:B5',
-                'values': [
-                    ['Header1', 'Header2'],
-                    ['Value1', 'Value2'],
-                ]
-            },
-            {
-                'range': 'Sheet2!C1:D10',
-                'values': [['Data'] * 2] * 10
-            }
-        ]
+        })
 
         result = batch_update_spreadsheet(
             spreadsheet_id='test-spreadsheet-id',
-            data=json.dumps(batch_data)
+            data=_BATCH_OK
         )
 
         mock_build.assert_called_once_with('sheets', 'v4', credentials=mock_creds)
@@ -249,13 +315,8 @@ class TestBatchUpdateSpreadsheet:
         # The actual function returns a success string
         assert 'Batch updated' in result or '2 ranges' in result
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_batch_update_json_parse_error(self, mock_get_creds, mock_build):
+    def test_batch_update_json_parse_error(self):
         """Test batch update with invalid JSON."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
-
         # Invalid JSON string
         invalid_json = "{'invalid': json syntax}"
 
@@ -267,24 +328,29 @@ class TestBatchUpdateSpreadsheet:
 
         assert 'Invalid JSON' in result
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_batch_update_malformed_data(self, mock_get_creds, mock_build):
+    def test_batch_update_rejects_non_list(self, patched_server):
+        """Test a JSON object is rejected before anything is sent."""
+        mock_build, _ = patched_server
+
+        result = batch_update_spreadsheet(
+            spreadsheet_id='test-spreadsheet-id',
+            data='{"range":"Sheet1!A1","values":[["X"]]}'
+        )
+
+        assert result.startswith("❌ Data must be a JSON array.")
+        mock_build.return_value.spreadsheets.return_value.values.return_value.batchUpdate.assert_not_called()
+
+    def test_batch_update_malformed_data(self, patched_server):
         """Test batch update with malformed data structure."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        error_content = b'{"error": {"code": 400, "message": "Invalid batch update data"}}'
-        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=400),
-            content=error_content
-        )
+        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute = Mock(side_effect=_ERR_400_BATCH)
 
         # Valid JSON but missing required fields
-        malformed_data = json.dumps([{'range': 'A1'}])  # Missing 'values'
+        malformed_data = _BATCH_MISSING_VALUES  # Missing 'values'
 
         # The actual function catches exceptions and returns error string
         result = batch_update_spreadsheet(
@@ -293,44 +359,105 @@ class TestBatchUpdateSpreadsheet:
         )
         assert isinstance(result, str)
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_batch_update_empty_data(self, mock_get_creds, mock_build):
+    def test_batch_update_empty_data(self, patched_server):
         """Test batch update with empty data array."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {
+        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute = Mock(return_value={
             'spreadsheetId': 'test-spreadsheet-id',
             'totalUpdatedCells': 0
-        }
+        })
 
         result = batch_update_spreadsheet(
             spreadsheet_id='test-spreadsheet-id',
-            data=json.dumps([])
+            data=_BATCH_EMPTY
         )
 
         # The actual function returns a success string
         assert 'Batch updated' in result or '0 ranges' in result
 
+    def test_batch_update_splits_large_payload(self, patched_server):
+        """Test oversize payloads are sent as sequential BATCH_CHUNK-sized batchUpdate calls."""
+        mock_build, _ = patched_server
+
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
+        mock_build.return_value = mock_sheets
+
+        batch_update = mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate
+        batch_update.return_value.execute = Mock(return_value={'totalUpdatedCells': 1000})
+
+        result = batch_update_spreadsheet(spreadsheet_id='test-spreadsheet-id', data=_BATCH_10K)
+
+        assert batch_update.call_count == 10_000 // server.BATCH_CHUNK
+        sizes = [len(c.kwargs['body']['data']) for c in batch_update.call_args_list]
+        assert max(sizes) <= server.BATCH_CHUNK
+        assert sum(sizes) == 10_000
+        assert batch_update.call_args_list[1].kwargs['body']['data'][0]['range'] == f'S!A{server.BATCH_CHUNK}'
+        assert '10000 ranges' in result
+        assert '10000 cells' in result
+
+    def test_batch_update_reports_partial_progress(self, patched_server):
+        """Test a failure after the first chunk reports the ranges already committed."""
+        mock_build, _ = patched_server
+
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
+        mock_build.return_value = mock_sheets
+
+        batch_update = mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate
+        batch_update.return_value.execute = Mock(side_effect=[{'totalUpdatedCells': 1000}] * 2 + [_ERR_400_BATCH])
+
+        result = batch_update_spreadsheet(spreadsheet_id='test-spreadsheet-id', data=_BATCH_10K)
+
+        applied = 2 * server.BATCH_CHUNK
+        assert result.startswith(f"❌ Applied {applied} of 10000 ranges (2000 cells) before error: ")
+        assert 'Invalid batch update data' in result
+        assert batch_update.call_count == 3
+
+    def test_batch_update_retries_rate_limit(self, patched_server, mock_sleep):
+        """Test batch update backs off exponentially on 429 and then succeeds."""
+        mock_build, _ = patched_server
+
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
+        mock_build.return_value = mock_sheets
+        execute = Mock(side_effect=[_ERR_429, _ERR_429, {'totalUpdatedCells': 22}])
+        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute = execute
+
+        result = batch_update_spreadsheet(spreadsheet_id='test-spreadsheet-id', data=_BATCH_OK)
+
+        assert execute.call_count == 3
+        assert mock_sleep.call_args_list == [call(1), call(2)]
+        assert result == "✅ Batch updated 2 ranges (22 cells)"
+
+    def test_batch_update_gives_up_after_max_retries(self, patched_server, mock_sleep):
+        """Test batch update stops retrying after MAX_RETRIES and reports the error."""
+        mock_build, _ = patched_server
+
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
+        mock_build.return_value = mock_sheets
+        execute = Mock(side_effect=_ERR_429)
+        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute = execute
+
+        result = batch_update_spreadsheet(spreadsheet_id='test-spreadsheet-id', data=_BATCH_OK)
+
+        assert execute.call_count == server.MAX_RETRIES + 1
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 4, 8]
+        assert 'Rate limit exceeded' in result
+
 
 class TestAddSheet:
     """Test add_sheet functionality."""
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_add_sheet_success(self, mock_get_creds, mock_build):
+    def test_add_sheet_success(self, patched_server):
         """Test successfully adding a new sheet."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, mock_creds = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {
+        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute = Mock(return_value={
             'spreadsheetId': 'test-spreadsheet-id',
             'replies': [
                 {
@@ -342,7 +469,7 @@ class TestAddSheet:
                     }
                 }
             ]
-        }
+        })
 
         result = add_sheet(
             spreadsheet_id='test-spreadsheet-id',
@@ -365,176 +492,98 @@ class TestAddSheet:
         # The actual function returns a success string
         assert 'New Sheet' in result or 'added' in result
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_add_sheet_duplicate_name(self, mock_get_creds, mock_build):
-        """Test adding sheet with duplicate name."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+    @pytest.mark.parametrize("status,msg", ADD_SHEET_ERROR_CASES)
+    def test_add_sheet_error(self, patched_server, status, msg):
+        """Test adding a duplicate sheet or adding to a non-existent spreadsheet."""
+        mock_build, _ = patched_server
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
-        error_content = b'{"error": {"code": 400, "message": "Sheet name already exists"}}'
-        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=400),
-            content=error_content
-        )
+        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute = \
+            Mock(side_effect=_HTTP_ERRORS[status, msg])
 
         # The actual function catches exceptions and returns error string
         result = add_sheet(
             spreadsheet_id='test-spreadsheet-id',
-            sheet_name='ExistingSheet'
-        )
-        assert isinstance(result, str)
-
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_add_sheet_invalid_spreadsheet(self, mock_get_creds, mock_build):
-        """Test adding sheet to non-existent spreadsheet."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
-
-        mock_sheets = MagicMock()
-        mock_build.return_value = mock_sheets
-
-        error_content = b'{"error": {"code": 404, "message": "Spreadsheet not found"}}'
-        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=404),
-            content=error_content
-        )
-
-        # The actual function catches exceptions and returns error string
-        result = add_sheet(
-            spreadsheet_id='nonexistent-id',
             sheet_name='New Sheet'
         )
-        assert isinstance(result, str)
+        assert str(status) in result
+        assert msg in result
 
 
 class TestExportSpreadsheet:
     """Test export_spreadsheet functionality."""
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_csv_success(self, mock_get_creds, mock_build):
-        """Test successful CSV export (text format)."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
-
-        mock_drive = MagicMock()
+    @pytest.mark.parametrize("fmt,mime,body,binary", [
+        ("csv", "text/csv", b"Name,Age,City\nJohn,30,NYC", False),
+        ("tsv", "text/tab-separated-values", b"Name\tAge\tCity\nJohn\t30\tNYC", False),
+        ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", b"PK\x03\x04", True),
+        ("pdf", "application/pdf", b"%PDF-1.4\n%\xE2\xE3\xCF\xD3", True),
+    ])
+    def test_export_success(self, patched_server, media_download, fmt, mime, body, binary):
+        """Test exporting in each supported format."""
+        mock_build, mock_creds = patched_server
+
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
-
-        csv_content = b"Name,Age,City\nJohn,30,NYC\nJane,25,LA"
-        mock_drive.files.return_value.export.return_value.execute.return_value = csv_content
+        media_download.content = body
 
         result = export_spreadsheet(
             spreadsheet_id='test-spreadsheet-id',
-            format='csv',
+            format=fmt,
             sheet_id=0
         )
 
         mock_build.assert_called_once_with('drive', 'v3', credentials=mock_creds)
-
-        # Verify export parameters
-        call_kwargs = mock_drive.files.return_value.export.call_args[1]
-        assert call_kwargs['fileId'] == 'test-spreadsheet-id'
-        assert call_kwargs['mimeType'] == 'text/csv'
-
-        # CSV should be returned as string
-        assert isinstance(result, str)
-        assert result == csv_content.decode('utf-8')
-        assert 'Name,Age,City' in result
-
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_tsv_success(self, mock_get_creds, mock_build):
-        """Test successful TSV export (text format)."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
-
-        mock_drive = MagicMock()
-        mock_build.return_value = mock_drive
-
-        tsv_content = b"Name\tAge\tCity\nJohn\t30\tNYC\nJane\t25\tLA"
-        mock_drive.files.return_value.export.return_value.execute.return_value = tsv_content
-
-        result = export_spreadsheet(
-            spreadsheet_id='test-spreadsheet-id',
-            format='tsv',
-            sheet_id=0
+        mock_drive.files.return_value.export_media.assert_called_once_with(
+            fileId='test-spreadsheet-id', mimeType=mime
         )
 
-        # Verify export MIME type
-        call_kwargs = mock_drive.files.return_value.export.call_args[1]
-        assert call_kwargs['mimeType'] == 'text/tab-separated-values'
-
-        # TSV should be returned as string
-        assert isinstance(result, str)
-        assert '\t' in result
+        if binary:
+            # Binary formats come back as a base64 excerpt
+            assert result.startswith(f"✅ Exported as {fmt} (base64, {len(body)} bytes):")
+            assert base64.b64encode(body).decode('utf-8') in result
+        else:
+            # Text formats are returned decoded
+            assert result == body.decode('utf-8')
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_xlsx_success(self, mock_get_creds, mock_build):
-        """Test successful XLSX export (binary format)."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+    def test_export_streams_in_bounded_chunks(self, patched_server, media_download):
+        """Test binary exports are downloaded via export_media in chunks of at most 1 MiB."""
+        mock_build, _ = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
+        media_download.content = b'%PDF-1.4'
 
-        # Simulate binary XLSX content
-        xlsx_content = b'\x50\x4b\x03\x04'  # ZIP file signature (XLSX files are ZIP)
-        mock_drive.files.return_value.export.return_value.execute.return_value = xlsx_content
+        export_spreadsheet(spreadsheet_id='test-spreadsheet-id', format='pdf')
 
-        result = export_spreadsheet(
-            spreadsheet_id='test-spreadsheet-id',
-            format='xlsx',
-            sheet_id=0
-        )
+        media_download.assert_called_once()
+        args, kwargs = media_download.call_args
+        assert args[1] is mock_drive.files.return_value.export_media.return_value
+        assert kwargs['chunksize'] <= 1024 * 1024
+        mock_drive.files.return_value.export.assert_not_called()
 
-        # Verify export MIME type
-        call_kwargs = mock_drive.files.return_value.export.call_args[1]
-        assert call_kwargs['mimeType'] == 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    def test_export_preview_encodes_only_excerpt(self, patched_server, media_download, monkeypatch):
+        """Test the base64 preview of a large binary encodes a bounded prefix, not the whole file."""
+        mock_build, _ = patched_server
 
-        # The actual function returns a formatted string with base64 excerpt
-        assert isinstance(result, str)
-        assert 'Exported as xlsx' in result or 'base64' in result
+        mock_build.return_value = copy.deepcopy(_DRIVE_TEMPLATE)
+        blob = b'\x00' * (10 * 1024 * 1024)
+        media_download.content = blob
+        b64encode = Mock(wraps=base64.b64encode)
+        monkeypatch.setattr(server.base64, "b64encode", b64encode)
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_pdf_success(self, mock_get_creds, mock_build):
-        """Test successful PDF export (binary format)."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        result = export_spreadsheet(spreadsheet_id='test-spreadsheet-id', format='xlsx')
 
-        mock_drive = MagicMock()
-        mock_build.return_value = mock_drive
-
-        # Simulate binary PDF content
-        pdf_content = b'%PDF-1.4\n%\xE2\xE3\xCF\xD3'  # PDF file signature
-        mock_drive.files.return_value.export.return_value.execute.return_value = pdf_content
+        (encoded_arg,), _ = b64encode.call_args
+        assert len(encoded_arg) <= 4096
+        assert f"(base64, {len(blob)} bytes)" in result
+        assert result.endswith(f"\n{'A' * 200}...")
 
-        result = export_spreadsheet(
-            spreadsheet_id='test-spreadsheet-id',
-            format='pdf',
-            sheet_id=0
-        )
-
-        # Verify export MIME type
-        call_kwargs = mock_drive.files.return_value.export.call_args[1]
-        assert call_kwargs['mimeType'] == 'application/pdf'
-
-        # The actual function returns a formatted string with base64 excerpt
-        assert isinstance(result, str)
-        assert 'Exported as pdf' in result or 'base64' in result
-
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_unsupported_format(self, mock_get_creds, mock_build):
+    def test_export_unsupported_format(self, patched_server):
         """Test export with unsupported format."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
         # The actual function returns an error string for unsupported formats
         result = export_spreadsheet(
@@ -544,19 +593,17 @@ class TestExportSpreadsheet:
         )
 
         assert 'Unsupported format' in result or 'unsupported_format' in result
+        mock_build.assert_not_called()
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_default_format(self, mock_get_creds, mock_build):
+    def test_export_default_format(self, patched_server, media_download):
         """Test export with default format (CSV)."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
 
         csv_content = b"Data"
-        mock_drive.files.return_value.export.return_value.execute.return_value = csv_content
+        media_download.content = csv_content
 
         # Call without specifying format (should default to CSV)
         result = export_spreadsheet(
@@ -565,67 +612,35 @@ class TestExportSpreadsheet:
         )
 
         # Verify CSV MIME type was used
-        call_kwargs = mock_drive.files.return_value.export.call_args[1]
+        call_kwargs = mock_drive.files.return_value.export_media.call_args[1]
         assert call_kwargs['mimeType'] == 'text/csv'
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_spreadsheet_not_found(self, mock_get_creds, mock_build):
-        """Test export of non-existent spreadsheet."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+    @pytest.mark.parametrize("status,msg", EXPORT_ERROR_CASES)
+    def test_export_error(self, patched_server, media_download, status, msg):
+        """Test exporting a non-existent or inaccessible spreadsheet."""
+        mock_build, _ = patched_server
 
-        mock_drive = MagicMock()
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
         mock_build.return_value = mock_drive
 
-        error_content = b'{"error": {"code": 404, "message": "File not found"}}'
-        mock_drive.files.return_value.export.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=404),
-            content=error_content
-        )
+        media_download.error = _HTTP_ERRORS[status, msg]
 
         # The actual function catches exceptions and returns error string
         result = export_spreadsheet(
-            spreadsheet_id='nonexistent-id',
-            format='csv',
-            sheet_id=0
-        )
-        assert isinstance(result, str)
-
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_export_permission_denied(self, mock_get_creds, mock_build):
-        """Test export with insufficient permissions."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
-
-        mock_drive = MagicMock()
-        mock_build.return_value = mock_drive
-
-        error_content = b'{"error": {"code": 403, "message": "Permission denied"}}'
-        mock_drive.files.return_value.export.return_value.execute.side_effect = HttpError(
-            resp=Mock(status=403),
-            content=error_content
-        )
-
-        # The actual function catches exceptions and returns error string
-        result = export_spreadsheet(
-            spreadsheet_id='restricted-spreadsheet-id',
+            spreadsheet_id='test-spreadsheet-id',
             format='csv',
             sheet_id=0
         )
-        assert isinstance(result, str)
+        assert str(status) in result
+        assert msg in result
 
 
 class TestIntegrationScenarios:
     """Test integration scenarios combining multiple operations."""
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_search_and_export_workflow(self, mock_get_creds, mock_build):
+    def test_search_and_export_workflow(self, patched_server, media_download):
         """Test workflow: search for spreadsheet, then export it."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, _ = patched_server
 
         # Setup mocks for both Drive and Sheets services
         def build_service(service_name, version, credentials):
@@ -635,21 +650,17 @@ class TestIntegrationScenarios:
 
                 # Mock search
                 mock_list = MagicMock()
-                mock_list.execute.return_value = {
+                mock_list.execute = Mock(return_value={
                     'files': [{'id': 'found-spreadsheet-id', 'name': 'Target Sheet', 'modifiedTime': '2024-01-01'}]
-                }
+                })
                 mock_files.list.return_value = mock_list
 
-                # Mock export
-                mock_export = MagicMock()
-                mock_export.execute.return_value = b"exported,data"
-                mock_files.export.return_value = mock_export
-
                 mock_drive.files.return_value = mock_files
                 return mock_drive
             return MagicMock()
 
         mock_build.side_effect = build_service
+        media_download.content = b"exported,data"
 
         # Search for spreadsheet
         search_results = search_spreadsheets(query="Target", max_results=1)
@@ -665,25 +676,111 @@ class TestIntegrationScenarios:
 
         assert exported_data == "exported,data"
 
-    @patch('google_cloud_mcp.server.build')
-    @patch('google_cloud_mcp.server.get_credentials')
-    def test_add_sheet_and_batch_update_workflow(self, mock_get_creds, mock_build):
+        # Search and export share one Drive client
+        assert mock_build.call_count == 1
+
+    def test_search_and_export_runs_exports_concurrently(self, patched_server, monkeypatch):
+        """Test search_and_export downloads all matches at the same time."""
+        mock_build, _ = patched_server
+
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
+        mock_build.return_value = mock_drive
+        mock_drive.files.return_value.list.return_value.execute = Mock(return_value={
+            'files': [{'id': 'sheet-a', 'name': 'Report A'}, {'id': 'sheet-b', 'name': 'Report B'}]
+        })
+
+        # Each download blocks until the other has started, so a serial
+        # implementation would break the barrier instead of completing.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def factory(fd, request, chunksize):
+            def next_chunk():
+                barrier.wait()
+                fd.write(b"a,b")
+                return None, True
+            return Mock(next_chunk=next_chunk)
+
+        monkeypatch.setattr(server, "MediaIoBaseDownload", factory)
+
+        result = asyncio.run(search_and_export(query="Report", format='csv'))
+
+        assert result == "📊 Report A (ID: sheet-a):\na,b\n\n📊 Report B (ID: sheet-b):\na,b"
+        mock_drive.files.return_value.list.assert_called_once()
+        assert mock_drive.files.return_value.export_media.call_count == 2
+
+    def test_search_and_export_bounded_workers(self, patched_server, monkeypatch):
+        """Test no more than EXPORT_WORKERS downloads run at once."""
+        mock_build, _ = patched_server
+
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
+        mock_build.return_value = mock_drive
+        mock_drive.files.return_value.list.return_value.execute = Mock(return_value={
+            'files': [{'id': f'sheet-{i}', 'name': f'Report {i}'} for i in range(10)]
+        })
+
+        lock = threading.Lock()
+        active = [0]
+        peak = []
+
+        def factory(fd, request, chunksize):
+            def next_chunk():
+                with lock:
+                    active[0] += 1
+                    peak.append(active[0])
+                time.sleep(0.01)
+                with lock:
+                    active[0] -= 1
+                fd.write(b"a,b")
+                return None, True
+            return Mock(next_chunk=next_chunk)
+
+        monkeypatch.setattr(server, "MediaIoBaseDownload", factory)
+
+        result = asyncio.run(search_and_export(query="Report", format='csv', max_results=10))
+
+        assert result.count("a,b") == 10
+        assert max(peak) <= server.EXPORT_WORKERS
+
+    def test_search_and_export_client_per_thread(self, patched_server, media_download):
+        """Test each worker thread builds one Drive client and reuses it for later matches."""
+        mock_build, _ = patched_server
+
+        mock_drive = copy.deepcopy(_DRIVE_TEMPLATE)
+        mock_drive.files.return_value.list.return_value.execute = Mock(return_value={
+            'files': [{'id': f'sheet-{i}', 'name': f'Report {i}'} for i in range(10)]
+        })
+        builders = []
+
+        def build_service(*args, **kwargs):
+            builders.append(threading.get_ident())
+            return mock_drive
+
+        mock_build.side_effect = build_service
+        media_download.content = b"a,b"
+
+        result = asyncio.run(search_and_export(query="Report", format='csv', max_results=10))
+
+        assert result.count("a,b") == 10
+        assert len(builders) == len(set(builders))
+
+    def test_add_sheet_and_batch_update_workflow(self, patched_server, monkeypatch):
         """Test workflow: add new sheet, then batch update data."""
-        mock_creds = Mock()
-        mock_get_creds.return_value = mock_creds
+        mock_build, mock_creds = patched_server
+        mock_get_creds = Mock(return_value=mock_creds)
+        monkeypatch.setattr(server, "get_credentials", mock_get_creds)
 
-        mock_sheets = MagicMock()
+        mock_sheets = copy.deepcopy(_SHEETS_TEMPLATE)
         mock_build.return_value = mock_sheets
 
         # Mock add sheet
-        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {
+        mock_sheets.spreadsheets.return_value.batchUpdate.return_value.execute = Mock(return_value={
             'replies': [{'addSheet': {'properties': {'sheetId': 999, 'title': 'DataSheet'}}}]
-        }
+        })
 
         # Mock batch update values
-        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute.return_value = {
+        mock_sheets.spreadsheets.return_value.values.return_value.batchUpdate.return_value.execute = Mock(return_value={
             'totalUpdatedCells': 10
-        }
+        })
 
         # Add new sheet
         add_result = add_sheet(
@@ -694,18 +791,17 @@ class TestIntegrationScenarios:
         assert 'DataSheet' in add_result or 'added' in add_result
 
         # Update data in new sheet
-        batch_data = json.dumps([{
-            'range': 'DataSheet!A1:B2',
-            'values': [['Header1', 'Header2'], ['Value1', 'Value2']]
-        }])
-
         update_result = batch_update_spreadsheet(
             spreadsheet_id='test-id',
-            data=batch_data
+            data=_BATCH_NEW_SHEET
         )
 
         assert 'Batch updated' in update_result or '1 ranges' in update_result
 
+        # Both calls share one authenticated Sheets client
+        mock_build.assert_called_once_with('sheets', 'v4', credentials=mock_creds)
+        mock_get_creds.assert_called_once()
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])